@@ -12,9 +12,10 @@ Usage:
 
 import asyncio
 import argparse
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
 
 # MCP SDK imports
@@ -29,7 +30,13 @@ try:
     HAS_MCP = True
 except ImportError:
     HAS_MCP = False
-    print("Warning: MCP SDK not installed. Install with: pip install mcp")
+
+# Optional libuv-based event loop (Linux/macOS)
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
 
 # Local imports
 from .tools.execute import ExecutionTool
@@ -51,12 +58,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger('crucible')
 
+# Reported through logging (stderr), never print: stdout carries the MCP stdio stream
+if not HAS_MCP:
+    logger.warning("MCP SDK not installed. Install with: pip install mcp")
+
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 FIXTURES_DIR = BASE_DIR / 'fixtures'
 LEARNINGS_DIR = BASE_DIR / 'learnings'
 DATA_DIR = BASE_DIR / 'data'  # For memory system
 
+# Input schema for tools that take no arguments (shared, never mutated)
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+
 
 class CrucibleServer:
     """
@@ -88,587 +102,579 @@ class CrucibleServer:
         self.verification_tool = VerificationTool()
         self.capture_tool = CaptureTool(self.fixture_store)
         self.learnings_tool = LearningsTool(self.learnings_store)
-        self.memory_tools = MemoryTools(self.memory_manager)
+        self.memory_tools = MemoryTools(self.memory_manager, self.memory_janitor)
         self.maintenance_tools = MaintenanceTools(BASE_DIR, self.memory_janitor)
 
         # Plugin system
         self.plugin_manager = get_plugin_manager()
         self.plugin_manager.load_enabled_plugins()
 
+        self._dispatch = self._build_dispatch()
+
+        # Built-in tool definitions, built on the first list_tools request
+        self._builtin_tools: Optional[List] = None
+
         if HAS_MCP:
             self.server = Server("crucible")
             self._register_handlers()
 
-    def _register_handlers(self):
-        """Register MCP tool handlers."""
-
-        @self.server.list_tools()
-        async def list_tools() -> List[Tool]:
-            return [
-                Tool(
-                    name="crucible_execute",
-                    description="Execute code or commands in an isolated environment. Use this to test code before delivering to user.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "code": {
-                                "type": "string",
-                                "description": "Code to execute"
-                            },
-                            "language": {
-                                "type": "string",
-                                "enum": ["python", "bash", "javascript", "go"],
-                                "description": "Programming language",
-                                "default": "python"
-                            },
-                            "timeout": {
-                                "type": "integer",
-                                "description": "Timeout in seconds",
-                                "default": 30
-                            },
-                            "isolated": {
-                                "type": "boolean",
-                                "description": "Run in Docker container for isolation",
-                                "default": True
-                            }
-                        },
-                        "required": ["code"]
-                    }
-                ),
-                Tool(
-                    name="crucible_verify",
-                    description="Verify code for syntax errors, import issues, type problems, and security concerns.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "code": {
-                                "type": "string",
-                                "description": "Code to verify"
-                            },
-                            "language": {
-                                "type": "string",
-                                "enum": ["python", "javascript", "go"],
-                                "description": "Programming language",
-                                "default": "python"
-                            },
-                            "checks": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Checks to run: syntax, imports, types, lint, security",
-                                "default": ["syntax", "imports"]
-                            }
-                        },
-                        "required": ["code"]
-                    }
-                ),
-                Tool(
-                    name="crucible_capture",
-                    description="Capture output from a command as a fixture for testing.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "command": {
-                                "type": "string",
-                                "description": "Command to run and capture"
-                            },
-                            "name": {
-                                "type": "string",
-                                "description": "Name for the fixture"
-                            },
-                            "category": {
-                                "type": "string",
-                                "description": "Category (linux, commands, apis)",
-                                "default": "commands"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Description of what this fixture contains"
-                            }
-                        },
-                        "required": ["command", "name"]
-                    }
-                ),
-                Tool(
-                    name="crucible_fixture",
-                    description="Retrieve a stored fixture for testing.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {
-                                "type": "string",
-                                "description": "Name of the fixture"
-                            },
-                            "category": {
-                                "type": "string",
-                                "description": "Category to search in"
-                            }
-                        },
-                        "required": ["name"]
-                    }
-                ),
-                Tool(
-                    name="crucible_note",
-                    description="Store a learning or note for future reference across sessions.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "topic": {
-                                "type": "string",
-                                "description": "Topic/category for this learning"
-                            },
-                            "title": {
-                                "type": "string",
-                                "description": "Brief title"
-                            },
-                            "content": {
-                                "type": "string",
-                                "description": "The learning content"
-                            },
-                            "tags": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Tags for searching"
-                            },
-                            "project": {
-                                "type": "string",
-                                "description": "Related project (ember, cinder, intuitive-os)"
-                            }
-                        },
-                        "required": ["topic", "title", "content"]
-                    }
-                ),
-                Tool(
-                    name="crucible_recall",
-                    description="Retrieve stored learnings by topic, tag, or search.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "topic": {
-                                "type": "string",
-                                "description": "Topic to retrieve"
-                            },
-                            "tag": {
-                                "type": "string",
-                                "description": "Tag to filter by"
-                            },
-                            "search": {
-                                "type": "string",
-                                "description": "Search term"
-                            },
-                            "project": {
-                                "type": "string",
-                                "description": "Filter by project"
-                            }
+    @property
+    def builtin_tools(self) -> "List[Tool]":
+        """Built-in tool definitions, constructed on first use."""
+        if self._builtin_tools is None:
+            self._builtin_tools = self._build_tools()
+        return self._builtin_tools
+
+    def _build_tools(self) -> "List[Tool]":
+        """Build the built-in tool definitions (static, so built once)."""
+        return [
+            Tool(
+                name="crucible_execute",
+                description="Execute code or commands in an isolated environment. Use this to test code before delivering to user.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "code": {
+                            "type": "string",
+                            "description": "Code to execute"
+                        },
+                        "language": {
+                            "type": "string",
+                            "enum": ["python", "bash", "javascript", "go"],
+                            "description": "Programming language",
+                            "default": "python"
+                        },
+                        "timeout": {
+                            "type": "integer",
+                            "description": "Timeout in seconds",
+                            "default": 30
+                        },
+                        "isolated": {
+                            "type": "boolean",
+                            "description": "Run in Docker container for isolation",
+                            "default": True
                         }
-                    }
-                ),
-                Tool(
-                    name="crucible_list_fixtures",
-                    description="List all available fixtures.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "category": {
-                                "type": "string",
-                                "description": "Category to list (optional)"
-                            }
+                    },
+                    "required": ["code"]
+                }
+            ),
+            Tool(
+                name="crucible_verify",
+                description="Verify code for syntax errors, import issues, type problems, and security concerns.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "code": {
+                            "type": "string",
+                            "description": "Code to verify"
+                        },
+                        "language": {
+                            "type": "string",
+                            "enum": ["python", "javascript", "go"],
+                            "description": "Programming language",
+                            "default": "python"
+                        },
+                        "checks": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Checks to run: syntax, imports, types, lint, security",
+                            "default": ["syntax", "imports"]
                         }
-                    }
-                ),
-                # Memory System Tools
-                Tool(
-                    name="crucible_session_start",
-                    description="Start a new memory session. Call this at the beginning of work to enable context tracking.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project": {
-                                "type": "string",
-                                "description": "Project name (ember, cinder, intuitive-os, etc.)"
-                            },
-                            "project_path": {
-                                "type": "string",
-                                "description": "Path to project directory"
-                            },
-                            "goal": {
-                                "type": "string",
-                                "description": "Primary goal for this session"
-                            }
+                    },
+                    "required": ["code"]
+                }
+            ),
+            Tool(
+                name="crucible_capture",
+                description="Capture output from a command as a fixture for testing.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "command": {
+                            "type": "string",
+                            "description": "Command to run and capture"
+                        },
+                        "name": {
+                            "type": "string",
+                            "description": "Name for the fixture"
+                        },
+                        "category": {
+                            "type": "string",
+                            "description": "Category (linux, commands, apis)",
+                            "default": "commands"
+                        },
+                        "description": {
+                            "type": "string",
+                            "description": "Description of what this fixture contains"
                         }
-                    }
-                ),
-                Tool(
-                    name="crucible_session_resume",
-                    description="Resume a previous session to restore context.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "session_id": {
-                                "type": "string",
-                                "description": "ID of session to resume"
-                            }
-                        },
-                        "required": ["session_id"]
-                    }
-                ),
-                Tool(
-                    name="crucible_session_end",
-                    description="End current session and save to long-term memory.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "quality_score": {
-                                "type": "number",
-                                "description": "Self-assessment of session quality (0-1)"
-                            }
+                    },
+                    "required": ["command", "name"]
+                }
+            ),
+            Tool(
+                name="crucible_fixture",
+                description="Retrieve a stored fixture for testing.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Name of the fixture"
+                        },
+                        "category": {
+                            "type": "string",
+                            "description": "Category to search in"
                         }
-                    }
-                ),
-                Tool(
-                    name="crucible_session_status",
-                    description="Get current session status and context.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="crucible_remember",
-                    description="Store something in memory (file read, decision, problem, insight, error).",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "what": {
-                                "type": "string",
-                                "description": "What to remember"
-                            },
-                            "category": {
-                                "type": "string",
-                                "enum": ["file", "decision", "problem", "insight", "error", "note"],
-                                "description": "Type of memory",
-                                "default": "note"
-                            },
-                            "context": {
-                                "type": "string",
-                                "description": "Additional context"
-                            }
-                        },
-                        "required": ["what"]
-                    }
-                ),
-                Tool(
-                    name="crucible_recall",
-                    description="Retrieve information from memory by search or filters.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search term"
-                            },
-                            "category": {
-                                "type": "string",
-                                "description": "Filter by category"
-                            },
-                            "project": {
-                                "type": "string",
-                                "description": "Filter by project"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum results",
-                                "default": 10
-                            }
+                    },
+                    "required": ["name"]
+                }
+            ),
+            Tool(
+                name="crucible_note",
+                description="Store a learning or note for future reference across sessions.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "topic": {
+                            "type": "string",
+                            "description": "Topic/category for this learning"
+                        },
+                        "title": {
+                            "type": "string",
+                            "description": "Brief title"
+                        },
+                        "content": {
+                            "type": "string",
+                            "description": "The learning content"
+                        },
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Tags for searching"
+                        },
+                        "project": {
+                            "type": "string",
+                            "description": "Related project (ember, cinder, intuitive-os)"
                         }
-                    }
-                ),
-                Tool(
-                    name="crucible_recall_project",
-                    description="Get all context and history for a specific project.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project": {
-                                "type": "string",
-                                "description": "Project name"
-                            }
-                        },
-                        "required": ["project"]
-                    }
-                ),
-                Tool(
-                    name="crucible_learn",
-                    description="Learn a fact about a codebase, tool, or pattern.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "subject": {
-                                "type": "string",
-                                "description": "What the fact is about"
-                            },
-                            "fact": {
-                                "type": "string",
-                                "description": "The fact to learn"
-                            },
-                            "category": {
-                                "type": "string",
-                                "enum": ["codebase", "user", "tool", "api", "pattern"],
-                                "description": "Type of knowledge",
-                                "default": "codebase"
-                            },
-                            "confidence": {
-                                "type": "number",
-                                "description": "How confident (0-1)",
-                                "default": 1.0
-                            },
-                            "tags": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Tags for searching"
-                            }
-                        },
-                        "required": ["subject", "fact"]
-                    }
-                ),
-                Tool(
-                    name="crucible_learn_preference",
-                    description="Learn a user preference for future sessions.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "preference": {
-                                "type": "string",
-                                "description": "Preference name"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Preference value"
-                            }
-                        },
-                        "required": ["preference", "value"]
-                    }
-                ),
-                Tool(
-                    name="crucible_context",
-                    description="Get current context including session, working memory, and user preferences.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="crucible_reflect",
-                    description="Get a full summary of all memory systems.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="crucible_task_start",
-                    description="Start a task within the current session to enable working memory.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "description": {
-                                "type": "string",
-                                "description": "What we're trying to accomplish"
-                            }
-                        },
-                        "required": ["description"]
-                    }
-                ),
-                Tool(
-                    name="crucible_task_complete",
-                    description="Complete the current task.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "summary": {
-                                "type": "string",
-                                "description": "Completion summary"
-                            }
+                    },
+                    "required": ["topic", "title", "content"]
+                }
+            ),
+            Tool(
+                name="crucible_recall",
+                description="Retrieve stored learnings by topic, tag, or search.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "topic": {
+                            "type": "string",
+                            "description": "Topic to retrieve"
+                        },
+                        "tag": {
+                            "type": "string",
+                            "description": "Tag to filter by"
+                        },
+                        "search": {
+                            "type": "string",
+                            "description": "Search term"
+                        },
+                        "project": {
+                            "type": "string",
+                            "description": "Filter by project"
                         }
                     }
-                ),
-                # Maintenance Tools
-                Tool(
-                    name="crucible_maintenance",
-                    description="Run memory maintenance (archive old sessions, decay stale facts, cleanup).",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "archive_days": {
-                                "type": "integer",
-                                "description": "Archive sessions older than this many days",
-                                "default": 7
-                            },
-                            "decay_days": {
-                                "type": "integer",
-                                "description": "Decay facts unverified for this many days",
-                                "default": 30
-                            },
-                            "cleanup_days": {
-                                "type": "integer",
-                                "description": "Clean up working memory older than this",
-                                "default": 3
-                            }
+                }
+            ),
+            Tool(
+                name="crucible_list_fixtures",
+                description="List all available fixtures.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "category": {
+                            "type": "string",
+                            "description": "Category to list (optional)"
                         }
                     }
-                ),
-                Tool(
-                    name="crucible_memory_stats",
-                    description="Get memory usage statistics.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                # System Maintenance Tools
-                Tool(
-                    name="crucible_cleanup",
-                    description="Run system cleanup (memory, filesystem, Docker). Modes: 'quick' (safe, frequent), 'deep' (weekly), 'full' (aggressive).",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "mode": {
-                                "type": "string",
-                                "enum": ["quick", "deep", "full"],
-                                "description": "Cleanup mode",
-                                "default": "quick"
-                            }
+                }
+            ),
+            # Memory System Tools
+            Tool(
+                name="crucible_session_start",
+                description="Start a new memory session. Call this at the beginning of work to enable context tracking.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project": {
+                            "type": "string",
+                            "description": "Project name (ember, cinder, intuitive-os, etc.)"
+                        },
+                        "project_path": {
+                            "type": "string",
+                            "description": "Path to project directory"
+                        },
+                        "goal": {
+                            "type": "string",
+                            "description": "Primary goal for this session"
                         }
                     }
-                ),
-                Tool(
-                    name="crucible_cleanup_docker",
-                    description="Docker-specific cleanup: containers, images, volumes, build cache.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "containers": {
-                                "type": "boolean",
-                                "description": "Remove stopped containers",
-                                "default": True
-                            },
-                            "images": {
-                                "type": "boolean",
-                                "description": "Prune dangling images",
-                                "default": True
-                            },
-                            "volumes": {
-                                "type": "boolean",
-                                "description": "Prune unused volumes (DANGEROUS!)",
-                                "default": False
-                            },
-                            "cache": {
-                                "type": "boolean",
-                                "description": "Prune build cache",
-                                "default": True
-                            }
+                }
+            ),
+            Tool(
+                name="crucible_session_resume",
+                description="Resume a previous session to restore context.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "session_id": {
+                            "type": "string",
+                            "description": "ID of session to resume"
                         }
-                    }
-                ),
-                Tool(
-                    name="crucible_cleanup_filesystem",
-                    description="Filesystem cleanup: temp files, logs, cache, execution artifacts.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "temp_hours": {
-                                "type": "integer",
-                                "description": "Delete temp files older than this many hours",
-                                "default": 24
-                            },
-                            "log_days": {
-                                "type": "integer",
-                                "description": "Delete logs older than this many days",
-                                "default": 7
-                            },
-                            "cache_days": {
-                                "type": "integer",
-                                "description": "Delete cache older than this many days",
-                                "default": 30
-                            }
+                    },
+                    "required": ["session_id"]
+                }
+            ),
+            Tool(
+                name="crucible_session_end",
+                description="End current session and save to long-term memory.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "quality_score": {
+                            "type": "number",
+                            "description": "Self-assessment of session quality (0-1)"
                         }
                     }
-                ),
-                Tool(
-                    name="crucible_system_status",
-                    description="Get complete system status (disk usage, Docker stats, memory stats).",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="crucible_disk_usage",
-                    description="Get detailed disk usage for Crucible directories.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
+                }
+            ),
+            Tool(
+                name="crucible_session_status",
+                description="Get current session status and context.",
+                inputSchema=_EMPTY_SCHEMA
+            ),
+            Tool(
+                name="crucible_remember",
+                description="Store something in memory (file read, decision, problem, insight, error).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "what": {
+                            "type": "string",
+                            "description": "What to remember"
+                        },
+                        "category": {
+                            "type": "string",
+                            "enum": ["file", "decision", "problem", "insight", "error", "note"],
+                            "description": "Type of memory",
+                            "default": "note"
+                        },
+                        "context": {
+                            "type": "string",
+                            "description": "Additional context"
+                        }
+                    },
+                    "required": ["what"]
+                }
+            ),
+            Tool(
+                name="crucible_recall",
+                description="Retrieve information from memory by search or filters.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Search term"
+                        },
+                        "category": {
+                            "type": "string",
+                            "description": "Filter by category"
+                        },
+                        "project": {
+                            "type": "string",
+                            "description": "Filter by project"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum results",
+                            "default": 10
+                        }
                     }
-                ),
-                Tool(
-                    name="crucible_docker_status",
-                    description="Get Docker resource status (containers, images, volumes).",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
+                }
+            ),
+            Tool(
+                name="crucible_recall_project",
+                description="Get all context and history for a specific project.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project": {
+                            "type": "string",
+                            "description": "Project name"
+                        }
+                    },
+                    "required": ["project"]
+                }
+            ),
+            Tool(
+                name="crucible_learn",
+                description="Learn a fact about a codebase, tool, or pattern.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "subject": {
+                            "type": "string",
+                            "description": "What the fact is about"
+                        },
+                        "fact": {
+                            "type": "string",
+                            "description": "The fact to learn"
+                        },
+                        "category": {
+                            "type": "string",
+                            "enum": ["codebase", "user", "tool", "api", "pattern"],
+                            "description": "Type of knowledge",
+                            "default": "codebase"
+                        },
+                        "confidence": {
+                            "type": "number",
+                            "description": "How confident (0-1)",
+                            "default": 1.0
+                        },
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Tags for searching"
+                        }
+                    },
+                    "required": ["subject", "fact"]
+                }
+            ),
+            Tool(
+                name="crucible_learn_preference",
+                description="Learn a user preference for future sessions.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "preference": {
+                            "type": "string",
+                            "description": "Preference name"
+                        },
+                        "value": {
+                            "type": "string",
+                            "description": "Preference value"
+                        }
+                    },
+                    "required": ["preference", "value"]
+                }
+            ),
+            Tool(
+                name="crucible_context",
+                description="Get current context including session, working memory, and user preferences.",
+                inputSchema=_EMPTY_SCHEMA
+            ),
+            Tool(
+                name="crucible_reflect",
+                description="Get a full summary of all memory systems.",
+                inputSchema=_EMPTY_SCHEMA
+            ),
+            Tool(
+                name="crucible_task_start",
+                description="Start a task within the current session to enable working memory.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "description": {
+                            "type": "string",
+                            "description": "What we're trying to accomplish"
+                        }
+                    },
+                    "required": ["description"]
+                }
+            ),
+            Tool(
+                name="crucible_task_complete",
+                description="Complete the current task.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "summary": {
+                            "type": "string",
+                            "description": "Completion summary"
+                        }
                     }
-                ),
-                # Plugin Management Tools
-                Tool(
-                    name="crucible_plugin_list",
-                    description="List available and loaded plugins.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
+                }
+            ),
+            # Maintenance Tools
+            Tool(
+                name="crucible_maintenance",
+                description="Run memory maintenance (archive old sessions, decay stale facts, cleanup).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "archive_days": {
+                            "type": "integer",
+                            "description": "Archive sessions older than this many days",
+                            "default": 7
+                        },
+                        "decay_days": {
+                            "type": "integer",
+                            "description": "Decay facts unverified for this many days",
+                            "default": 30
+                        },
+                        "cleanup_days": {
+                            "type": "integer",
+                            "description": "Clean up working memory older than this",
+                            "default": 3
+                        }
                     }
-                ),
-                Tool(
-                    name="crucible_plugin_load",
-                    description="Load a plugin to add new tools.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {
-                                "type": "string",
-                                "description": "Plugin name (e.g., 'devops')"
-                            }
-                        },
-                        "required": ["name"]
+                }
+            ),
+            Tool(
+                name="crucible_memory_stats",
+                description="Get memory usage statistics.",
+                inputSchema=_EMPTY_SCHEMA
+            ),
+            # System Maintenance Tools
+            Tool(
+                name="crucible_cleanup",
+                description="Run system cleanup (memory, filesystem, Docker). Modes: 'quick' (safe, frequent), 'deep' (weekly), 'full' (aggressive).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "mode": {
+                            "type": "string",
+                            "enum": ["quick", "deep", "full"],
+                            "description": "Cleanup mode",
+                            "default": "quick"
+                        }
                     }
-                ),
-                Tool(
-                    name="crucible_plugin_unload",
-                    description="Unload a plugin to remove its tools.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {
-                                "type": "string",
-                                "description": "Plugin name to unload"
-                            }
-                        },
-                        "required": ["name"]
+                }
+            ),
+            Tool(
+                name="crucible_cleanup_docker",
+                description="Docker-specific cleanup: containers, images, volumes, build cache.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "containers": {
+                            "type": "boolean",
+                            "description": "Remove stopped containers",
+                            "default": True
+                        },
+                        "images": {
+                            "type": "boolean",
+                            "description": "Prune dangling images",
+                            "default": True
+                        },
+                        "volumes": {
+                            "type": "boolean",
+                            "description": "Prune unused volumes (DANGEROUS!)",
+                            "default": False
+                        },
+                        "cache": {
+                            "type": "boolean",
+                            "description": "Prune build cache",
+                            "default": True
+                        }
                     }
-                ),
-                Tool(
-                    name="crucible_plugin_reload",
-                    description="Reload a plugin (picks up code changes).",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {
-                                "type": "string",
-                                "description": "Plugin name to reload"
-                            }
-                        },
-                        "required": ["name"]
+                }
+            ),
+            Tool(
+                name="crucible_cleanup_filesystem",
+                description="Filesystem cleanup: temp files, logs, cache, execution artifacts.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "temp_hours": {
+                            "type": "integer",
+                            "description": "Delete temp files older than this many hours",
+                            "default": 24
+                        },
+                        "log_days": {
+                            "type": "integer",
+                            "description": "Delete logs older than this many days",
+                            "default": 7
+                        },
+                        "cache_days": {
+                            "type": "integer",
+                            "description": "Delete cache older than this many days",
+                            "default": 30
+                        }
                     }
-                ),
-            ] + self.plugin_manager.get_tools()
+                }
+            ),
+            Tool(
+                name="crucible_system_status",
+                description="Get complete system status (disk usage, Docker stats, memory stats).",
+                inputSchema=_EMPTY_SCHEMA
+            ),
+            Tool(
+                name="crucible_disk_usage",
+                description="Get detailed disk usage for Crucible directories.",
+                inputSchema=_EMPTY_SCHEMA
+            ),
+            Tool(
+                name="crucible_docker_status",
+                description="Get Docker resource status (containers, images, volumes).",
+                inputSchema=_EMPTY_SCHEMA
+            ),
+            # Plugin Management Tools
+            Tool(
+                name="crucible_plugin_list",
+                description="List available and loaded plugins.",
+                inputSchema=_EMPTY_SCHEMA
+            ),
+            Tool(
+                name="crucible_plugin_load",
+                description="Load a plugin to add new tools.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Plugin name (e.g., 'devops')"
+                        }
+                    },
+                    "required": ["name"]
+                }
+            ),
+            Tool(
+                name="crucible_plugin_unload",
+                description="Unload a plugin to remove its tools.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Plugin name to unload"
+                        }
+                    },
+                    "required": ["name"]
+                }
+            ),
+            Tool(
+                name="crucible_plugin_reload",
+                description="Reload a plugin (picks up code changes).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Plugin name to reload"
+                        }
+                    },
+                    "required": ["name"]
+                }
+            ),
+        ]
+
+    def _register_handlers(self):
+        """Register MCP tool handlers."""
+
+        @self.server.list_tools()
+        async def list_tools() -> List[Tool]:
+            return self.builtin_tools + self.plugin_manager.get_tools()
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
@@ -683,211 +689,176 @@ class CrucibleServer:
                     content=[TextContent(type="text", text=f"Error: {str(e)}")]
                 )
 
-    async def _handle_tool(self, name: str, args: Dict[str, Any]) -> str:
-        """Route tool calls to appropriate handlers."""
+    def _build_dispatch(self) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+        """
+        Map built-in tool names to handlers.
 
-        if name == "crucible_execute":
-            return await self.execution_tool.execute(
+        Handlers take the tool arguments and return either a string or an
+        awaitable resolving to one.
+        """
+        return {
+            "crucible_execute": lambda args: self.execution_tool.execute(
                 code=args["code"],
                 language=args.get("language", "python"),
                 timeout=args.get("timeout", 30),
                 isolated=args.get("isolated", True)
-            )
-
-        elif name == "crucible_verify":
-            return await self.verification_tool.verify(
+            ),
+            "crucible_verify": lambda args: self.verification_tool.verify(
                 code=args["code"],
                 language=args.get("language", "python"),
                 checks=args.get("checks", ["syntax", "imports"])
-            )
-
-        elif name == "crucible_capture":
-            return await self.capture_tool.capture(
+            ),
+            "crucible_capture": lambda args: self.capture_tool.capture(
                 command=args["command"],
                 name=args["name"],
                 category=args.get("category", "commands"),
                 description=args.get("description", "")
-            )
-
-        elif name == "crucible_fixture":
-            return self.fixture_store.get(
+            ),
+            "crucible_fixture": lambda args: self.fixture_store.get(
                 name=args["name"],
                 category=args.get("category")
-            )
-
-        elif name == "crucible_note":
-            return self.learnings_tool.note(
+            ),
+            "crucible_note": lambda args: self.learnings_tool.note(
                 topic=args["topic"],
                 title=args["title"],
                 content=args["content"],
                 tags=args.get("tags", []),
                 project=args.get("project")
-            )
-
-        elif name == "crucible_recall":
-            return self.learnings_tool.recall(
+            ),
+            # Also declared by the memory tools; the learnings handler has
+            # always taken precedence for this name.
+            "crucible_recall": lambda args: self.learnings_tool.recall(
                 topic=args.get("topic"),
                 tag=args.get("tag"),
                 search=args.get("search"),
                 project=args.get("project")
-            )
-
-        elif name == "crucible_list_fixtures":
-            return self.fixture_store.list_fixtures(
+            ),
+            "crucible_list_fixtures": lambda args: self.fixture_store.list_fixtures(
                 category=args.get("category")
-            )
+            ),
 
-        # Memory System Tools
-        elif name == "crucible_session_start":
-            return self.memory_tools.session_start(
+            # Memory System Tools
+            "crucible_session_start": lambda args: self.memory_tools.session_start(
                 project=args.get("project"),
                 project_path=args.get("project_path"),
                 goal=args.get("goal")
-            )
-
-        elif name == "crucible_session_resume":
-            return self.memory_tools.session_resume(
+            ),
+            "crucible_session_resume": lambda args: self.memory_tools.session_resume(
                 session_id=args["session_id"]
-            )
-
-        elif name == "crucible_session_end":
-            return self.memory_tools.session_end(
+            ),
+            "crucible_session_end": lambda args: self.memory_tools.session_end(
                 quality_score=args.get("quality_score")
-            )
-
-        elif name == "crucible_session_status":
-            return self.memory_tools.session_status()
-
-        elif name == "crucible_remember":
-            return self.memory_tools.remember(
+            ),
+            "crucible_session_status": lambda args: self.memory_tools.session_status(),
+            "crucible_remember": lambda args: self.memory_tools.remember(
                 what=args["what"],
                 category=args.get("category", "note"),
                 context=args.get("context")
-            )
-
-        elif name == "crucible_recall":
-            return self.memory_tools.recall(
-                query=args.get("query"),
-                category=args.get("category"),
-                project=args.get("project"),
-                limit=args.get("limit", 10)
-            )
-
-        elif name == "crucible_recall_project":
-            return self.memory_tools.recall_project(
+            ),
+            "crucible_recall_project": lambda args: self.memory_tools.recall_project(
                 project=args["project"]
-            )
-
-        elif name == "crucible_learn":
-            return self.memory_tools.learn(
+            ),
+            "crucible_learn": lambda args: self.memory_tools.learn(
                 subject=args["subject"],
                 fact=args["fact"],
                 category=args.get("category", "codebase"),
                 confidence=args.get("confidence", 1.0),
                 tags=args.get("tags")
-            )
-
-        elif name == "crucible_learn_preference":
-            return self.memory_tools.learn_preference(
+            ),
+            "crucible_learn_preference": lambda args: self.memory_tools.learn_preference(
                 preference=args["preference"],
                 value=args["value"]
-            )
-
-        elif name == "crucible_context":
-            return self.memory_tools.context()
-
-        elif name == "crucible_reflect":
-            return self.memory_tools.reflect()
-
-        elif name == "crucible_task_start":
-            return self.memory_tools.task_start(
+            ),
+            "crucible_context": lambda args: self.memory_tools.context(),
+            "crucible_reflect": lambda args: self.memory_tools.reflect(),
+            "crucible_task_start": lambda args: self.memory_tools.task_start(
                 description=args["description"]
-            )
-
-        elif name == "crucible_task_complete":
-            return self.memory_tools.task_complete(
+            ),
+            "crucible_task_complete": lambda args: self.memory_tools.task_complete(
                 summary=args.get("summary")
-            )
+            ),
 
-        # Maintenance Tools
-        elif name == "crucible_maintenance":
-            return self.memory_tools.maintenance(
+            # Maintenance Tools
+            "crucible_maintenance": lambda args: self.memory_tools.maintenance(
                 archive_days=args.get("archive_days", 7),
                 decay_days=args.get("decay_days", 30),
                 cleanup_days=args.get("cleanup_days", 3)
-            )
+            ),
+            "crucible_memory_stats": lambda args: self.memory_tools.memory_stats(),
 
-        elif name == "crucible_memory_stats":
-            return self.memory_tools.memory_stats()
-
-        # System Maintenance Tools
-        elif name == "crucible_cleanup":
-            return self.maintenance_tools.cleanup(
+            # System Maintenance Tools
+            "crucible_cleanup": lambda args: self.maintenance_tools.cleanup(
                 mode=args.get("mode", "quick")
-            )
-
-        elif name == "crucible_cleanup_docker":
-            return self.maintenance_tools.cleanup_docker(
+            ),
+            # Docker CLI calls and directory walks can take seconds to minutes and
+            # touch no memory state, so run them in a worker thread rather than
+            # stalling the event loop (and every other tool call) meanwhile
+            "crucible_cleanup_docker": lambda args: asyncio.to_thread(
+                self.maintenance_tools.cleanup_docker,
                 containers=args.get("containers", True),
                 images=args.get("images", True),
                 volumes=args.get("volumes", False),
                 cache=args.get("cache", True)
-            )
-
-        elif name == "crucible_cleanup_filesystem":
-            return self.maintenance_tools.cleanup_filesystem(
+            ),
+            "crucible_cleanup_filesystem": lambda args: asyncio.to_thread(
+                self.maintenance_tools.cleanup_filesystem,
                 temp_hours=args.get("temp_hours", 24),
                 log_days=args.get("log_days", 7),
                 cache_days=args.get("cache_days", 30)
-            )
+            ),
+            "crucible_system_status": lambda args: self.maintenance_tools.system_status(),
+            "crucible_disk_usage": lambda args: asyncio.to_thread(self.maintenance_tools.disk_usage),
+            "crucible_docker_status": lambda args: asyncio.to_thread(self.maintenance_tools.docker_status),
+
+            # Plugin Management Tools
+            "crucible_plugin_list": lambda args: self.plugin_manager.status(),
+            "crucible_plugin_load": self._plugin_load,
+            "crucible_plugin_unload": self._plugin_unload,
+            "crucible_plugin_reload": self._plugin_reload,
+        }
+
+    def _plugin_load(self, args: Dict[str, Any]) -> str:
+        plugin_name = args.get("name")
+        if not plugin_name:
+            return "Error: plugin name required"
+        success = self.plugin_manager.load_plugin(plugin_name)
+        if success:
+            return f"Plugin '{plugin_name}' loaded successfully.\n\n{self.plugin_manager.status()}"
+        return f"Failed to load plugin '{plugin_name}'"
+
+    def _plugin_unload(self, args: Dict[str, Any]) -> str:
+        plugin_name = args.get("name")
+        if not plugin_name:
+            return "Error: plugin name required"
+        success = self.plugin_manager.unload_plugin(plugin_name)
+        if success:
+            return f"Plugin '{plugin_name}' unloaded.\n\n{self.plugin_manager.status()}"
+        return f"Failed to unload plugin '{plugin_name}'"
+
+    def _plugin_reload(self, args: Dict[str, Any]) -> str:
+        plugin_name = args.get("name")
+        if not plugin_name:
+            return "Error: plugin name required"
+        success = self.plugin_manager.reload_plugin(plugin_name)
+        if success:
+            return f"Plugin '{plugin_name}' reloaded.\n\n{self.plugin_manager.status()}"
+        return f"Failed to reload plugin '{plugin_name}'"
 
-        elif name == "crucible_system_status":
-            return self.maintenance_tools.system_status()
-
-        elif name == "crucible_disk_usage":
-            return self.maintenance_tools.disk_usage()
-
-        elif name == "crucible_docker_status":
-            return self.maintenance_tools.docker_status()
-
-        # Plugin Management Tools
-        elif name == "crucible_plugin_list":
-            return self.plugin_manager.status()
-
-        elif name == "crucible_plugin_load":
-            plugin_name = args.get("name")
-            if not plugin_name:
-                return "Error: plugin name required"
-            success = self.plugin_manager.load_plugin(plugin_name)
-            if success:
-                return f"Plugin '{plugin_name}' loaded successfully.\n\n{self.plugin_manager.status()}"
-            return f"Failed to load plugin '{plugin_name}'"
-
-        elif name == "crucible_plugin_unload":
-            plugin_name = args.get("name")
-            if not plugin_name:
-                return "Error: plugin name required"
-            success = self.plugin_manager.unload_plugin(plugin_name)
-            if success:
-                return f"Plugin '{plugin_name}' unloaded.\n\n{self.plugin_manager.status()}"
-            return f"Failed to unload plugin '{plugin_name}'"
-
-        elif name == "crucible_plugin_reload":
-            plugin_name = args.get("name")
-            if not plugin_name:
-                return "Error: plugin name required"
-            success = self.plugin_manager.reload_plugin(plugin_name)
-            if success:
-                return f"Plugin '{plugin_name}' reloaded.\n\n{self.plugin_manager.status()}"
-            return f"Failed to reload plugin '{plugin_name}'"
-
-        else:
+    async def _handle_tool(self, name: str, args: Dict[str, Any]) -> str:
+        """Route tool calls to appropriate handlers."""
+        handler = self._dispatch.get(name)
+        if handler is None:
             # Check if plugin can handle this tool
             result = await self.plugin_manager.handle_tool(name, args)
             if result is not None:
                 return result
             return f"Unknown tool: {name}"
 
+        result = handler(args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
     async def run_stdio(self):
         """Run server using stdio transport (for Claude Code integration)."""
         if not HAS_MCP:
@@ -919,6 +890,9 @@ def main():
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     server = CrucibleServer()
 
     if args.transport == "stdio":
@@ -9,13 +9,48 @@ Handles:
 """
 
 import logging
+import re
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger('crucible.maintenance.docker')
 
+# Sizes in docker output, e.g. "1.2GB", "500MB", "100kB"
+_SIZE_RE = re.compile(r'([\d.]+)\s*(GB|MB|KB|B)', re.IGNORECASE)
+
+# Result of the `docker version` probe, shared by everything in the process
+_docker_probe: Optional[bool] = None
+
+
+def check_docker() -> bool:
+    """
+    Check if Docker is available.
+
+    The probe spawns `docker version` (up to 10s), so it runs once per
+    process; DockerJanitor and ExecutionTool share the result.
+    """
+    global _docker_probe
+    if _docker_probe is None:
+        try:
+            result = subprocess.run(
+                ["docker", "version"],
+                capture_output=True,
+                timeout=10
+            )
+            _docker_probe = result.returncode == 0
+        except Exception:
+            _docker_probe = False
+    return _docker_probe
+
 
 class DockerJanitor:
     """
@@ -40,20 +75,11 @@ class DockerJanitor:
         "golang:1.21-alpine"
     ]
 
-    def __init__(self):
-        self._docker_available = self._check_docker()
+    # Concurrent docker CLI calls when inspecting/removing containers
+    MAX_WORKERS = 8
 
-    def _check_docker(self) -> bool:
-        """Check if Docker is available."""
-        try:
-            result = subprocess.run(
-                ["docker", "version"],
-                capture_output=True,
-                timeout=10
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+    def __init__(self):
+        self._docker_available = check_docker()
 
     def run_cleanup(
         self,
@@ -146,27 +172,38 @@ class DockerJanitor:
 
             cutoff = datetime.now() - timedelta(hours=max_age_hours)
 
+            # Collect victims first, then fan the per-container CLI calls out
+            victims = []
+            candidates = []
             for line in result.stdout.strip().split('\n'):
                 if not line:
                     continue
 
                 try:
-                    container = json.loads(line)
+                    container = orjson.loads(line) if HAS_ORJSON else json.loads(line)
                     container_id = container.get('ID', '')
                     status = container.get('Status', '')
                     names = container.get('Names', '')
 
                     # Only clean Crucible containers or exited containers
-                    is_crucible = names.startswith(self.CONTAINER_PREFIX)
-                    is_exited = 'Exited' in status
-
-                    if is_exited and (is_crucible or self._is_old_container(container_id, cutoff)):
-                        self._remove_container(container_id)
-                        removed += 1
+                    if 'Exited' not in status:
+                        continue
+                    if names.startswith(self.CONTAINER_PREFIX):
+                        victims.append(container_id)
+                    else:
+                        candidates.append(container_id)
 
                 except json.JSONDecodeError:
                     continue
 
+            if not (victims or candidates):
+                return 0
+
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                is_old = executor.map(lambda cid: self._is_old_container(cid, cutoff), candidates)
+                victims.extend(cid for cid, old in zip(candidates, is_old) if old)
+                removed = sum(executor.map(self._remove_container, victims))
+
         except subprocess.TimeoutExpired:
             logger.warning("Docker ps timed out")
         except Exception as e:
@@ -300,10 +337,7 @@ class DockerJanitor:
 
     def _parse_size_to_mb(self, text: str) -> float:
         """Parse Docker size string to MB."""
-        import re
-
-        # Look for patterns like "1.2GB", "500MB", "100kB"
-        match = re.search(r'([\d.]+)\s*(GB|MB|KB|B)', text, re.IGNORECASE)
+        match = _SIZE_RE.search(text)
         if match:
             value = float(match.group(1))
             unit = match.group(2).upper()
@@ -390,7 +424,7 @@ class DockerJanitor:
                 for line in result.stdout.strip().split('\n'):
                     if line:
                         try:
-                            data = json.loads(line)
+                            data = orjson.loads(line) if HAS_ORJSON else json.loads(line)
                             stats['system'][data.get('Type', 'unknown')] = {
                                 'size': data.get('Size', '0B'),
                                 'reclaimable': data.get('Reclaimable', '0B')
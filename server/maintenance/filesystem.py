@@ -10,10 +10,12 @@ Handles:
 """
 
 import os
+import fnmatch
 import logging
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import shutil
 
 logger = logging.getLogger('crucible.maintenance.filesystem')
@@ -115,15 +117,23 @@ class FilesystemJanitor:
         """
         result = {'files': 0, 'bytes': 0}
 
+        if not self.logs_dir.exists():
+            return result
+
+        # One directory walk feeds both phases
+        logs = list(self._scan_files(self.logs_dir, "*.log"))
+
         # Phase 1: Delete old logs
         cutoff = datetime.now() - timedelta(days=max_age_days)
-        age_result = self._delete_old_files(self.logs_dir, cutoff, pattern="*.log")
+        age_result = self._delete_old_files(self.logs_dir, cutoff, files=logs)
         result['files'] += age_result['files']
         result['bytes'] += age_result['bytes']
 
-        # Phase 2: Enforce size limit
+        # Phase 2: Enforce size limit over the logs phase 1 kept
         max_bytes = max_size_mb * 1024 * 1024
-        size_result = self._enforce_size_limit(self.logs_dir, max_bytes, pattern="*.log")
+        cutoff_ts = cutoff.timestamp()
+        kept = [(path, stat) for path, stat in logs if stat.st_mtime >= cutoff_ts]
+        size_result = self._enforce_size_limit(self.logs_dir, max_bytes, files=kept)
         result['files'] += size_result['files']
         result['bytes'] += size_result['bytes']
 
@@ -134,29 +144,53 @@ class FilesystemJanitor:
         cutoff = datetime.now() - timedelta(days=max_age_days)
         return self._delete_old_files(self.cache_dir, cutoff)
 
+    def _scan_files(self, directory: Path, pattern: str = "*") -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        Recursively yield (path, stat) for files whose name matches pattern.
+
+        Walks with os.scandir so each file costs a single stat() call,
+        rather than the several a Path.rglob/is_file/stat chain makes.
+        Symlinked directories are not descended into.
+        """
+        pending = [str(directory)]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                                yield entry.path, entry.stat()
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.warning(f"Cannot scan {current}: {e}")
+
     def _delete_old_files(
         self,
         directory: Path,
         cutoff: datetime,
-        pattern: str = "*"
+        pattern: str = "*",
+        files: Optional[List[Tuple[str, os.stat_result]]] = None
     ) -> Dict[str, int]:
-        """Delete files older than cutoff datetime."""
+        """Delete files older than cutoff datetime (files: pre-scanned entries)."""
         result = {'files': 0, 'bytes': 0}
 
-        if not directory.exists():
-            return result
-
-        for file_path in directory.rglob(pattern):
-            if not file_path.is_file():
-                continue
+        if files is None:
+            if not directory.exists():
+                return result
+            files = self._scan_files(directory, pattern)
 
+        # Compare raw st_mtime floats instead of building a datetime per file
+        cutoff_ts = cutoff.timestamp()
+        for file_path, stat in files:
             try:
-                mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if mtime < cutoff:
-                    size = file_path.stat().st_size
-                    file_path.unlink()
+                if stat.st_mtime < cutoff_ts:
+                    os.unlink(file_path)
                     result['files'] += 1
-                    result['bytes'] += size
+                    result['bytes'] += stat.st_size
                     logger.debug(f"Deleted old file: {file_path}")
             except Exception as e:
                 logger.warning(f"Failed to delete {file_path}: {e}")
@@ -167,43 +201,41 @@ class FilesystemJanitor:
         self,
         directory: Path,
         max_bytes: int,
-        pattern: str = "*"
+        pattern: str = "*",
+        files: Optional[List[Tuple[str, os.stat_result]]] = None
     ) -> Dict[str, int]:
-        """Delete oldest files until directory is under size limit."""
+        """Delete oldest files until directory is under size limit (files: pre-scanned entries)."""
         result = {'files': 0, 'bytes': 0}
 
-        if not directory.exists():
-            return result
+        if files is None:
+            if not directory.exists():
+                return result
+            files = self._scan_files(directory, pattern)
 
         # Get all matching files with their sizes and mtimes
-        files = []
+        candidates = []
         total_size = 0
-        for file_path in directory.rglob(pattern):
-            if file_path.is_file():
-                try:
-                    stat = file_path.stat()
-                    files.append({
-                        'path': file_path,
-                        'size': stat.st_size,
-                        'mtime': stat.st_mtime
-                    })
-                    total_size += stat.st_size
-                except:
-                    pass
+        for file_path, stat in files:
+            candidates.append({
+                'path': file_path,
+                'size': stat.st_size,
+                'mtime': stat.st_mtime
+            })
+            total_size += stat.st_size
 
         if total_size <= max_bytes:
             return result
 
         # Sort by mtime (oldest first)
-        files.sort(key=lambda x: x['mtime'])
+        candidates.sort(key=lambda x: x['mtime'])
 
         # Delete until under limit
-        for f in files:
+        for f in candidates:
             if total_size <= max_bytes:
                 break
 
             try:
-                f['path'].unlink()
+                os.unlink(f['path'])
                 result['files'] += 1
                 result['bytes'] += f['size']
                 total_size -= f['size']
@@ -258,13 +290,9 @@ class FilesystemJanitor:
             if path.exists():
                 total_size = 0
                 file_count = 0
-                for f in path.rglob('*'):
-                    if f.is_file():
-                        try:
-                            total_size += f.stat().st_size
-                            file_count += 1
-                        except:
-                            pass
+                for _, stat in self._scan_files(path):
+                    total_size += stat.st_size
+                    file_count += 1
 
                 stats[name] = {
                     'files': file_count,
@@ -287,7 +315,6 @@ class FilesystemJanitor:
         Returns:
             Path to temp file
         """
-        import tempfile
         fd, path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=self.temp_dir)
         os.close(fd)
         return Path(path)
@@ -302,5 +329,4 @@ class FilesystemJanitor:
         Returns:
             Path to temp directory
         """
-        import tempfile
         return Path(tempfile.mkdtemp(prefix=prefix, dir=self.temp_dir))
@@ -9,24 +9,36 @@ Stores summaries of what happened in previous sessions:
 """
 
 import json
+import os
 from pathlib import Path
-from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field, fields, asdict
 from typing import Optional, Dict, List, Any
 import logging
 
 try:
     import yaml
     HAS_YAML = True
+    # Use the libyaml C bindings when PyYAML was built with them
+    try:
+        from yaml import CSafeLoader as YamlLoader, CDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader, Dumper as YamlDumper
 except ImportError:
     HAS_YAML = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .session import SessionState
 
 logger = logging.getLogger('crucible.memory.episodic')
 
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     """
     Summary of a session converted to long-term memory.
@@ -118,6 +130,14 @@ class Episode:
             quality_score=quality_score
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Episode':
+        """Build from a stored dict, ignoring keys this version doesn't know."""
+        return cls(**{k: v for k, v in data.items() if k in _EPISODE_FIELDS})
+
+
+_EPISODE_FIELDS = frozenset(f.name for f in fields(Episode))
+
 
 class EpisodicMemory:
     """
@@ -134,6 +154,11 @@ class EpisodicMemory:
         self.base_path = Path(base_path) / 'episodes'
         self.base_path.mkdir(parents=True, exist_ok=True)
 
+        # Parsed file contents, keyed by path and validated by (mtime, size)
+        self._cache: Dict[Path, tuple] = {}
+        # Lowercased search text per cached file: path -> (episodes, texts)
+        self._search_text: Dict[Path, tuple] = {}
+
     def store_episode(self, episode: Episode):
         """
         Store an episode in long-term memory.
@@ -141,30 +166,42 @@ class EpisodicMemory:
         Args:
             episode: Episode to store
         """
-        # Store by project if available, otherwise general
-        if episode.project:
-            file_path = self.base_path / f"{episode.project}.yaml"
-        else:
-            file_path = self.base_path / "general.yaml"
-
-        # Load existing episodes
-        episodes = self._load_file(file_path)
+        self.store_episodes([episode])
 
-        # Check for duplicate
-        existing_idx = None
-        for i, e in enumerate(episodes):
-            if e.get('session_id') == episode.session_id:
-                existing_idx = i
-                break
-
-        episode_dict = asdict(episode)
-        if existing_idx is not None:
-            episodes[existing_idx] = episode_dict
-        else:
-            episodes.append(episode_dict)
+    def store_episodes(self, episodes: List[Episode]):
+        """
+        Store several episodes, reading and writing each project file once.
 
-        self._save_file(file_path, episodes)
-        logger.info(f"Stored episode: {episode.session_id}")
+        Args:
+            episodes: Episodes to store
+        """
+        # Store by project if available, otherwise general
+        by_file: Dict[Path, List[Episode]] = {}
+        for episode in episodes:
+            if episode.project:
+                file_path = self.base_path / f"{episode.project}.yaml"
+            else:
+                file_path = self.base_path / "general.yaml"
+            by_file.setdefault(file_path, []).append(episode)
+
+        for file_path, batch in by_file.items():
+            # Load existing episodes, indexed for duplicate checks
+            stored = self._load_file(file_path)
+            index: Dict[str, int] = {}
+            for i, e in enumerate(stored):
+                index.setdefault(e.get('session_id'), i)
+
+            for episode in batch:
+                episode_dict = asdict(episode)
+                existing_idx = index.get(episode.session_id)
+                if existing_idx is not None:
+                    stored[existing_idx] = episode_dict
+                else:
+                    index[episode.session_id] = len(stored)
+                    stored.append(episode_dict)
+                logger.info(f"Stored episode: {episode.session_id}")
+
+            self._save_file(file_path, stored)
 
     def convert_session(self, session: SessionState, quality_score: float = None) -> Episode:
         """
@@ -196,7 +233,7 @@ class EpisodicMemory:
         episodes = self._load_file(file_path)
 
         # Convert to Episode objects
-        result = [Episode(**e) for e in episodes]
+        result = [Episode.from_dict(e) for e in episodes]
 
         # Sort by date descending
         result.sort(key=lambda x: x.date, reverse=True)
@@ -217,11 +254,11 @@ class EpisodicMemory:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
 
         all_episodes = []
-        for yaml_file in self.base_path.glob("*.yaml"):
+        for yaml_file in self._episode_files():
             episodes = self._load_file(yaml_file)
             for e in episodes:
                 if e.get('date', '') >= cutoff:
-                    all_episodes.append(Episode(**e))
+                    all_episodes.append(Episode.from_dict(e))
 
         # Sort by date descending
         all_episodes.sort(key=lambda x: x.date, reverse=True)
@@ -241,13 +278,13 @@ class EpisodicMemory:
         all_episodes = []
 
         if project:
+            # _load_file returns [] for a missing file; no separate exists() stat
             file_path = self.base_path / f"{project}.yaml"
-            if file_path.exists():
-                all_episodes = [Episode(**e) for e in self._load_file(file_path)]
+            all_episodes = [Episode.from_dict(e) for e in self._load_file(file_path)]
         else:
-            for yaml_file in self.base_path.glob("*.yaml"):
+            for yaml_file in self._episode_files():
                 episodes = self._load_file(yaml_file)
-                all_episodes.extend([Episode(**e) for e in episodes])
+                all_episodes.extend([Episode.from_dict(e) for e in episodes])
 
         # Filter to those with unfinished items
         unfinished = [
@@ -277,31 +314,19 @@ class EpisodicMemory:
         Returns:
             Matching Episodes
         """
-        all_episodes = []
-
         if project:
-            file_path = self.base_path / f"{project}.yaml"
-            if file_path.exists():
-                all_episodes = self._load_file(file_path)
+            paths = [self.base_path / f"{project}.yaml"]
         else:
-            for yaml_file in self.base_path.glob("*.yaml"):
-                all_episodes.extend(self._load_file(yaml_file))
+            paths = self._episode_files()
 
         query_lower = query.lower()
         matches = []
 
-        for e in all_episodes:
-            # Search in various fields
-            searchable = [
-                e.get('goal', ''),
-                ' '.join(e.get('accomplished', [])),
-                ' '.join(e.get('decisions', [])),
-                ' '.join(e.get('insights', [])),
-                ' '.join(e.get('problems_solved', [])),
-            ]
-
-            if any(query_lower in s.lower() for s in searchable):
-                matches.append(Episode(**e))
+        for path in paths:
+            episodes, texts = self._searchable(path)
+            for e, text in zip(episodes, texts):
+                if query_lower in text:
+                    matches.append(Episode.from_dict(e))
 
         # Sort by date descending
         matches.sort(key=lambda x: x.date, reverse=True)
@@ -368,11 +393,9 @@ class EpisodicMemory:
         all_episodes = []
 
         if project:
-            file_path = self.base_path / f"{project}.yaml"
-            if file_path.exists():
-                all_episodes = self._load_file(file_path)
+            all_episodes = self._load_file(self.base_path / f"{project}.yaml")
         else:
-            for yaml_file in self.base_path.glob("*.yaml"):
+            for yaml_file in self._episode_files():
                 all_episodes.extend(self._load_file(yaml_file))
 
         # Count problem types, insight themes, etc.
@@ -393,15 +416,87 @@ class EpisodicMemory:
         # Filter to min occurrences
         return {k: v for k, v in patterns.items() if v >= min_occurrences}
 
+    def episode_counts(self) -> Dict[str, int]:
+        """
+        Number of stored episodes per project.
+
+        Served from the parse cache, so repeated stats calls only stat files.
+        A file that fails to parse is logged and counted as empty.
+        """
+        counts = {}
+        for path in self._episode_files():
+            try:
+                counts[path.stem] = len(self._cached_episodes(path))
+            except Exception as e:
+                logger.warning(f"Could not count episodes in {path}: {e}")
+                counts[path.stem] = 0
+        return counts
+
+    def _episode_files(self) -> List[Path]:
+        """Per-project episode files, listed with a single os.scandir pass."""
+        try:
+            with os.scandir(self.base_path) as entries:
+                return [Path(e.path) for e in entries if e.name.endswith('.yaml') and e.is_file()]
+        except FileNotFoundError:
+            return []
+
+    def _searchable(self, path: Path) -> tuple:
+        """
+        Cached episodes of a file, paired with their lowercased search text.
+
+        The text (goal, accomplishments, decisions, insights, problems solved)
+        is lowercased once per parse rather than on every search. Fields are
+        NUL-separated so a query never matches across two of them.
+        """
+        episodes = self._cached_episodes(path)
+        cached = self._search_text.get(path)
+        if cached is None or cached[0] is not episodes:
+            texts = [
+                '\0'.join([
+                    e.get('goal', ''),
+                    ' '.join(e.get('accomplished', [])),
+                    ' '.join(e.get('decisions', [])),
+                    ' '.join(e.get('insights', [])),
+                    ' '.join(e.get('problems_solved', [])),
+                ]).lower()
+                for e in episodes
+            ]
+            cached = (episodes, texts)
+            self._search_text[path] = cached
+        return cached
+
     def _load_file(self, path: Path) -> List[Dict]:
-        """Load episodes from a file."""
-        if not path.exists():
+        """
+        Load episodes from a file.
+
+        Parsed contents are cached until the file changes on disk, so recall
+        and search don't re-parse YAML. Callers get fresh dicts they may mutate.
+        """
+        return [dict(e) for e in self._cached_episodes(path)]
+
+    def _cached_episodes(self, path: Path) -> List[Dict]:
+        """Cached parse of an episodes file (shared; must not be mutated)."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return []
 
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(path)
+        if cached is None or cached[0] != key:
+            cached = (key, self._parse_file(path))
+            self._cache[path] = cached
+
+        return cached[1]
+
+    def _parse_file(self, path: Path) -> List[Dict]:
+        """Parse an episodes file from disk."""
         content = path.read_text(encoding='utf-8')
 
         if HAS_YAML:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YamlLoader)
+        elif HAS_ORJSON:
+            data = orjson.loads(content)
         else:
             data = json.loads(content)
 
@@ -412,12 +507,13 @@ class EpisodicMemory:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         if HAS_YAML:
-            content = yaml.dump(episodes, default_flow_style=False, sort_keys=False)
+            payload = yaml.dump(episodes, Dumper=YamlDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+        elif HAS_ORJSON:
+            payload = orjson.dumps(episodes, option=orjson.OPT_INDENT_2)
         else:
-            content = json.dumps(episodes, indent=2)
-
-        path.write_text(content, encoding='utf-8')
+            payload = json.dumps(episodes, indent=2).encode('utf-8')
 
+        path.write_bytes(payload)
 
-# Need timedelta for recall_recent
-from datetime import timedelta
+        stat = path.stat()
+        self._cache[path] = ((stat.st_mtime_ns, stat.st_size), [dict(e) for e in episodes])
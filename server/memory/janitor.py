@@ -10,6 +10,8 @@ Provides scheduled maintenance tasks:
 """
 
 import logging
+import os
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -18,9 +20,20 @@ import json
 try:
     import yaml
     HAS_YAML = True
+    # Use the libyaml C bindings when PyYAML was built with them
+    try:
+        from yaml import CSafeLoader as YamlLoader, CDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader, Dumper as YamlDumper
 except ImportError:
     HAS_YAML = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .session import SessionMemory, SessionState
 from .episodic import EpisodicMemory, Episode
 from .semantic import SemanticMemory
@@ -116,46 +129,85 @@ class MemoryJanitor:
         archive_path = sessions_path / 'archive'
         archive_path.mkdir(exist_ok=True)
 
-        for session_file in sessions_path.glob("sess_*.yaml"):
+        stale = []
+        for session_file in self._scan(sessions_path, 'sess_'):
             try:
                 content = session_file.read_text(encoding='utf-8')
                 if HAS_YAML:
-                    data = yaml.safe_load(content)
+                    data = yaml.load(content, Loader=YamlLoader)
+                elif HAS_ORJSON:
+                    data = orjson.loads(content)
                 else:
                     data = json.loads(content)
 
                 updated_at = data.get('updated_at', '')
                 if updated_at < cutoff:
-                    # Convert to episode before archiving
-                    session = SessionState(**data)
-                    self.episodic.convert_session(session)
-
-                    # Move to archive
-                    session_file.rename(archive_path / session_file.name)
-                    archived += 1
-                    logger.info(f"Archived old session: {session_file.name}")
+                    episode = Episode.from_session(SessionState.from_dict(data))
+                    stale.append((session_file, episode))
 
             except Exception as e:
                 logger.warning(f"Error processing {session_file}: {e}")
 
+        if not stale:
+            return 0
+
+        # Convert to episodes before archiving, one write per project file
+        try:
+            self.episodic.store_episodes([episode for _, episode in stale])
+        except Exception as e:
+            # Fall back to one store per episode (stores replace by session_id,
+            # so a partly applied batch is safe to repeat) and only archive the
+            # sessions whose episode was kept
+            logger.warning(f"Error storing archived episodes, retrying one by one: {e}")
+            stored = []
+            for session_file, episode in stale:
+                try:
+                    self.episodic.store_episodes([episode])
+                    stored.append((session_file, episode))
+                except Exception as e:
+                    logger.warning(f"Error converting {session_file}: {e}")
+            stale = stored
+
+        for session_file, _ in stale:
+            try:
+                # Move to archive
+                session_file.replace(archive_path / session_file.name)
+                archived += 1
+                logger.info(f"Archived old session: {session_file.name}")
+            except Exception as e:
+                logger.warning(f"Error archiving {session_file}: {e}")
+
         return archived
 
+    def _scan(self, directory: Path, prefix: str) -> List[Path]:
+        """<prefix>*.yaml files in a directory, listed with a single os.scandir pass."""
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    Path(e.path) for e in entries
+                    if e.name.startswith(prefix) and e.name.endswith('.yaml') and e.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
     def _decay_old_facts(self, days_old: int, decay_factor: float) -> int:
         """Reduce confidence of facts that haven't been verified recently."""
         decayed = 0
         cutoff = (datetime.utcnow() - timedelta(days=days_old)).isoformat() + "Z"
 
         for category in self.semantic.categories:
-            file_path = self.semantic.base_path / f"{category}.yaml"
-            if not file_path.exists():
+            file_path = self.semantic.category_files[category]
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except FileNotFoundError:
                 continue
-
-            content = file_path.read_text(encoding='utf-8')
             if not content.strip():
                 continue
 
             if HAS_YAML:
-                facts = yaml.safe_load(content)
+                facts = yaml.load(content, Loader=YamlLoader)
+            elif HAS_ORJSON:
+                facts = orjson.loads(content)
             else:
                 facts = json.loads(content)
 
@@ -175,10 +227,12 @@ class MemoryJanitor:
 
             if modified:
                 if HAS_YAML:
-                    new_content = yaml.dump(facts, default_flow_style=False, sort_keys=False)
+                    payload = yaml.dump(facts, Dumper=YamlDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+                elif HAS_ORJSON:
+                    payload = orjson.dumps(facts, option=orjson.OPT_INDENT_2)
                 else:
-                    new_content = json.dumps(facts, indent=2)
-                file_path.write_text(new_content, encoding='utf-8')
+                    payload = json.dumps(facts, indent=2).encode('utf-8')
+                file_path.write_bytes(payload)
 
         return decayed
 
@@ -191,18 +245,27 @@ class MemoryJanitor:
         completed_path = working_path / 'completed'
         completed_path.mkdir(exist_ok=True)
 
-        for task_file in working_path.glob("task_*.yaml"):
+        # A task file is written after its task starts, so one last modified
+        # before the cutoff is stale without parsing it
+        cutoff_ts = time.time() - days_old * 86400
+
+        for task_file in self._scan(working_path, 'task_'):
             try:
-                content = task_file.read_text(encoding='utf-8')
-                if HAS_YAML:
-                    data = yaml.safe_load(content)
+                if task_file.stat().st_mtime < cutoff_ts:
+                    started_at = ''
                 else:
-                    data = json.loads(content)
+                    content = task_file.read_text(encoding='utf-8')
+                    if HAS_YAML:
+                        data = yaml.load(content, Loader=YamlLoader)
+                    elif HAS_ORJSON:
+                        data = orjson.loads(content)
+                    else:
+                        data = json.loads(content)
+                    started_at = data.get('started_at', '')
 
-                started_at = data.get('started_at', '')
                 if started_at < cutoff:
                     # Move to completed/archived
-                    task_file.rename(completed_path / task_file.name)
+                    task_file.replace(completed_path / task_file.name)
                     cleaned += 1
                     logger.info(f"Cleaned old task: {task_file.name}")
 
@@ -216,16 +279,18 @@ class MemoryJanitor:
         removed = 0
 
         for category in self.semantic.categories:
-            file_path = self.semantic.base_path / f"{category}.yaml"
-            if not file_path.exists():
+            file_path = self.semantic.category_files[category]
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except FileNotFoundError:
                 continue
-
-            content = file_path.read_text(encoding='utf-8')
             if not content.strip():
                 continue
 
             if HAS_YAML:
-                facts = yaml.safe_load(content)
+                facts = yaml.load(content, Loader=YamlLoader)
+            elif HAS_ORJSON:
+                facts = orjson.loads(content)
             else:
                 facts = json.loads(content)
 
@@ -235,6 +300,7 @@ class MemoryJanitor:
             # Group by subject+predicate
             seen = {}
             unique_facts = []
+            category_removed = 0
 
             for fact in facts:
                 key = f"{fact.get('subject')}:{fact.get('predicate')}"
@@ -250,20 +316,24 @@ class MemoryJanitor:
                         unique_facts.remove(existing)
                         unique_facts.append(fact)
                         seen[key] = fact
-                        removed += 1
+                        category_removed += 1
                     else:
                         # Keep existing, discard new
-                        removed += 1
+                        category_removed += 1
                 else:
                     seen[key] = fact
                     unique_facts.append(fact)
 
-            if removed > 0:
+            # Only rewrite files that actually had duplicates
+            if category_removed > 0:
+                removed += category_removed
                 if HAS_YAML:
-                    new_content = yaml.dump(unique_facts, default_flow_style=False, sort_keys=False)
+                    payload = yaml.dump(unique_facts, Dumper=YamlDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+                elif HAS_ORJSON:
+                    payload = orjson.dumps(unique_facts, option=orjson.OPT_INDENT_2)
                 else:
-                    new_content = json.dumps(unique_facts, indent=2)
-                file_path.write_text(new_content, encoding='utf-8')
+                    payload = json.dumps(unique_facts, indent=2).encode('utf-8')
+                file_path.write_bytes(payload)
 
         return removed
 
@@ -276,51 +346,29 @@ class MemoryJanitor:
         lines.append("")
 
         # Sessions
-        sessions = list(self.session.base_path.glob("sess_*.yaml"))
-        archived = list((self.session.base_path / 'archive').glob("sess_*.yaml")) if (self.session.base_path / 'archive').exists() else []
+        sessions = self._scan(self.session.base_path, 'sess_')
+        archived = self._scan(self.session.base_path / 'archive', 'sess_')
         lines.append(f"Sessions:")
         lines.append(f"  Active: {len(sessions)}")
         lines.append(f"  Archived: {len(archived)}")
         lines.append("")
 
-        # Episodes
-        episode_files = list(self.episodic.base_path.glob("*.yaml"))
-        total_episodes = 0
-        for ef in episode_files:
-            content = ef.read_text(encoding='utf-8')
-            if content.strip():
-                if HAS_YAML:
-                    episodes = yaml.safe_load(content)
-                else:
-                    episodes = json.loads(content)
-                if episodes:
-                    total_episodes += len(episodes)
-
+        # Episodes and facts are counted from the stores' parse caches
+        episode_counts = self.episodic.episode_counts()
         lines.append(f"Episodes:")
-        lines.append(f"  Total: {total_episodes}")
-        lines.append(f"  Projects: {len(episode_files)}")
+        lines.append(f"  Total: {sum(episode_counts.values())}")
+        lines.append(f"  Projects: {len(episode_counts)}")
         lines.append("")
 
         # Semantic facts
         lines.append(f"Semantic Facts:")
         for category in self.semantic.categories:
-            file_path = self.semantic.base_path / f"{category}.yaml"
-            count = 0
-            if file_path.exists():
-                content = file_path.read_text(encoding='utf-8')
-                if content.strip():
-                    if HAS_YAML:
-                        facts = yaml.safe_load(content)
-                    else:
-                        facts = json.loads(content)
-                    if facts:
-                        count = len(facts)
-            lines.append(f"  {category}: {count}")
+            lines.append(f"  {category}: {self.semantic.count_facts(category)}")
         lines.append("")
 
         # Working memory
-        tasks = list(self.working.base_path.glob("task_*.yaml"))
-        completed = list((self.working.base_path / 'completed').glob("task_*.yaml")) if (self.working.base_path / 'completed').exists() else []
+        tasks = self._scan(self.working.base_path, 'task_')
+        completed = self._scan(self.working.base_path / 'completed', 'task_')
         lines.append(f"Working Memory:")
         lines.append(f"  Active tasks: {len(tasks)}")
         lines.append(f"  Completed: {len(completed)}")
@@ -339,42 +387,23 @@ class MemoryJanitor:
         }
 
         # Sessions
-        stats['active_sessions'] = len(list(self.session.base_path.glob("sess_*.yaml")))
-        archive_path = self.session.base_path / 'archive'
-        if archive_path.exists():
-            stats['archived_sessions'] = len(list(archive_path.glob("sess_*.yaml")))
+        stats['active_sessions'] = len(self._scan(self.session.base_path, 'sess_'))
+        stats['archived_sessions'] = len(self._scan(self.session.base_path / 'archive', 'sess_'))
 
-        # Episodes
-        for ef in self.episodic.base_path.glob("*.yaml"):
-            try:
-                content = ef.read_text(encoding='utf-8')
-                if content.strip():
-                    if HAS_YAML:
-                        episodes = yaml.safe_load(content)
-                    else:
-                        episodes = json.loads(content)
-                    if episodes:
-                        stats['total_episodes'] += len(episodes)
-            except:
-                pass
+        # Episodes (from the episodic store's parse cache)
+        try:
+            stats['total_episodes'] = sum(self.episodic.episode_counts().values())
+        except:
+            pass
 
         # Facts
         for category in self.semantic.categories:
-            file_path = self.semantic.base_path / f"{category}.yaml"
-            if file_path.exists():
-                try:
-                    content = file_path.read_text(encoding='utf-8')
-                    if content.strip():
-                        if HAS_YAML:
-                            facts = yaml.safe_load(content)
-                        else:
-                            facts = json.loads(content)
-                        if facts:
-                            stats['total_facts'] += len(facts)
-                except:
-                    pass
+            try:
+                stats['total_facts'] += self.semantic.count_facts(category)
+            except:
+                pass
 
         # Tasks
-        stats['active_tasks'] = len(list(self.working.base_path.glob("task_*.yaml")))
+        stats['active_tasks'] = len(self._scan(self.working.base_path, 'task_'))
 
         return stats
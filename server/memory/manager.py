@@ -156,9 +156,8 @@ class MemoryManager:
             # Record completion in session
             self.session.complete_task(ctx.description)
 
-            # Store any insights
-            for note in ctx.notes:
-                self.session.add_insight(note)
+            # Store any insights (one session write for all notes)
+            self.session.add_insights(ctx.notes)
 
             # Complete in working memory
             self.working.complete_task(summary)
@@ -253,8 +252,7 @@ class MemoryManager:
     def remember_file_read(self, file_path: str, summary: str = None):
         """Record reading a file across memory systems."""
         self.session.record_file_read(file_path)
-        self.working.record_read(file_path, summary)
-        self.working.add_relevant_file(file_path)
+        self.working.record_read(file_path, summary, relevant=True)
 
     def remember_file_modified(self, file_path: str):
         """Record modifying a file."""
@@ -354,12 +352,13 @@ class MemoryManager:
         Returns:
             Combined search results
         """
+        query_lower = query.lower()
         return {
             'facts': [
                 {'subject': f.subject, 'predicate': f.predicate, 'value': f.value}
                 for f in self.semantic.recall()
-                if query.lower() in str(f.value).lower() or
-                   query.lower() in f.subject.lower()
+                if query_lower in str(f.value).lower() or
+                   query_lower in f.subject.lower()
             ][:10],
             'episodes': [
                 {'date': e.date, 'project': e.project, 'goal': e.goal}
@@ -11,22 +11,34 @@ Stores structured knowledge:
 
 import json
 from pathlib import Path
-from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field, fields, asdict
 from typing import Optional, Dict, List, Any
 import logging
 import hashlib
+import sys
 
 try:
     import yaml
     HAS_YAML = True
+    # Use the libyaml C bindings when PyYAML was built with them
+    try:
+        from yaml import CSafeLoader as YamlLoader, CDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader, Dumper as YamlDumper
 except ImportError:
     HAS_YAML = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger('crucible.memory.semantic')
 
 
-@dataclass
+@dataclass(slots=True)
 class Fact:
     """
     A single fact or piece of knowledge.
@@ -53,14 +65,27 @@ class Fact:
     id: str = ""
 
     def __post_init__(self):
-        now = datetime.utcnow().isoformat() + "Z"
-        if not self.learned_at:
-            self.learned_at = now
-        if not self.verified_at:
-            self.verified_at = now
+        # Categories come from a tiny fixed set; share one string object each
+        if isinstance(self.category, str):
+            self.category = sys.intern(self.category)
+        # Facts loaded from disk already carry timestamps; only new ones need a clock read
+        if not (self.learned_at and self.verified_at):
+            now = datetime.utcnow().isoformat() + "Z"
+            if not self.learned_at:
+                self.learned_at = now
+            if not self.verified_at:
+                self.verified_at = now
         if not self.id:
             content = f"{self.category}:{self.subject}:{self.predicate}"
-            self.id = hashlib.md5(content.encode()).hexdigest()[:12]
+            self.id = hashlib.md5(content.encode()).digest()[:6].hex()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Fact':
+        """Build from a stored dict, ignoring keys this version doesn't know."""
+        return cls(**{k: v for k, v in data.items() if k in _FACT_FIELDS})
+
+
+_FACT_FIELDS = frozenset(f.name for f in fields(Fact))
 
 
 class SemanticMemory:
@@ -78,10 +103,16 @@ class SemanticMemory:
         self.base_path = Path(base_path) / 'semantic'
         self.base_path.mkdir(parents=True, exist_ok=True)
 
-        # Category-specific files
+        # Parsed file contents, keyed by path and validated by (mtime, size)
+        self._cache: Dict[Path, tuple] = {}
+
+        # Category-specific files (paths built once, not per call)
         self.categories = ['codebase', 'user', 'tool', 'api', 'pattern']
-        for cat in self.categories:
-            (self.base_path / f"{cat}.yaml").touch(exist_ok=True)
+        self.category_files: Dict[str, Path] = {
+            cat: self.base_path / f"{cat}.yaml" for cat in self.categories
+        }
+        for path in self.category_files.values():
+            path.touch(exist_ok=True)
 
     def learn(
         self,
@@ -122,7 +153,7 @@ class SemanticMemory:
         )
 
         # Check for existing fact with same subject/predicate
-        file_path = self.base_path / f"{category}.yaml"
+        file_path = self._category_file(category)
         facts = self._load_file(file_path)
 
         existing_idx = None
@@ -173,10 +204,8 @@ class SemanticMemory:
         categories_to_search = [category] if category else self.categories
 
         for cat in categories_to_search:
-            file_path = self.base_path / f"{cat}.yaml"
-            if file_path.exists():
-                facts = self._load_file(file_path)
-                all_facts.extend(facts)
+            # A missing file loads as [], so there's no need to stat it first
+            all_facts.extend(self._load_file(self._category_file(cat)))
 
         # Apply filters
         results = []
@@ -192,7 +221,7 @@ class SemanticMemory:
             if f.get('confidence', 1.0) < min_confidence:
                 continue
 
-            results.append(Fact(**f))
+            results.append(Fact.from_dict(f))
 
         # Sort by confidence descending
         results.sort(key=lambda x: x.confidence, reverse=True)
@@ -225,7 +254,7 @@ class SemanticMemory:
             True if removed, False if not found
         """
         for cat in self.categories:
-            file_path = self.base_path / f"{cat}.yaml"
+            file_path = self._category_file(cat)
             facts = self._load_file(file_path)
             original_len = len(facts)
 
@@ -250,7 +279,7 @@ class SemanticMemory:
             True if found and updated
         """
         for cat in self.categories:
-            file_path = self.base_path / f"{cat}.yaml"
+            file_path = self._category_file(cat)
             facts = self._load_file(file_path)
 
             for i, f in enumerate(facts):
@@ -272,11 +301,10 @@ class SemanticMemory:
             days_old: How old before decay applies
             decay_factor: Multiplier to apply to confidence
         """
-        from datetime import timedelta
         cutoff = (datetime.utcnow() - timedelta(days=days_old)).isoformat() + "Z"
 
         for cat in self.categories:
-            file_path = self.base_path / f"{cat}.yaml"
+            file_path = self._category_file(cat)
             facts = self._load_file(file_path)
             modified = False
 
@@ -344,12 +372,18 @@ class SemanticMemory:
 
     def get_codebase_facts(self, project: str) -> List[Fact]:
         """Get all facts about a codebase."""
-        facts = self.recall(category='codebase', project=project)
-        # Also get facts with subject starting with project:
-        all_facts = self.recall(category='codebase')
-        for f in all_facts:
-            if f.subject.startswith(f"{project}:") and f not in facts:
+        # One recall, partitioned: the project's own facts first, then other
+        # facts whose subject starts with "project:". Splitting on project
+        # replaces an O(n*m) `not in` scan comparing whole Facts.
+        prefix = f"{project}:"
+        facts = []
+        extra = []
+        for f in self.recall(category='codebase'):
+            if f.project == project:
                 facts.append(f)
+            elif f.subject.startswith(prefix):
+                extra.append(f)
+        facts.extend(extra)
         return facts
 
     def get_user_preferences(self) -> Dict[str, Any]:
@@ -370,7 +404,7 @@ class SemanticMemory:
         lines = ["=== Semantic Memory Summary ===", ""]
 
         for cat in self.categories:
-            file_path = self.base_path / f"{cat}.yaml"
+            file_path = self._category_file(cat)
             facts = self._load_file(file_path)
 
             if project:
@@ -388,17 +422,51 @@ class SemanticMemory:
 
         return "\n".join(lines)
 
+    def _category_file(self, category: str) -> Path:
+        """Get the file for a category."""
+        path = self.category_files.get(category)
+        if path is None:
+            path = self.category_files[category] = self.base_path / f"{category}.yaml"
+        return path
+
+    def count_facts(self, category: str) -> int:
+        """Number of facts stored in a category, without copying them."""
+        return len(self._cached_facts(self._category_file(category)))
+
     def _load_file(self, path: Path) -> List[Dict]:
-        """Load facts from a file."""
-        if not path.exists():
+        """
+        Load facts from a file.
+
+        Parsed contents are cached until the file changes on disk, so repeated
+        recalls don't re-parse YAML. Callers get fresh dicts they may mutate.
+        """
+        return [dict(f) for f in self._cached_facts(path)]
+
+    def _cached_facts(self, path: Path) -> List[Dict]:
+        """Cached parse of a facts file (shared; must not be mutated)."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return []
 
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(path)
+        if cached is None or cached[0] != key:
+            cached = (key, self._parse_file(path))
+            self._cache[path] = cached
+
+        return cached[1]
+
+    def _parse_file(self, path: Path) -> List[Dict]:
+        """Parse a facts file from disk."""
         content = path.read_text(encoding='utf-8')
         if not content.strip():
             return []
 
         if HAS_YAML:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YamlLoader)
+        elif HAS_ORJSON:
+            data = orjson.loads(content)
         else:
             data = json.loads(content)
 
@@ -409,8 +477,13 @@ class SemanticMemory:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         if HAS_YAML:
-            content = yaml.dump(facts, default_flow_style=False, sort_keys=False)
+            payload = yaml.dump(facts, Dumper=YamlDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+        elif HAS_ORJSON:
+            payload = orjson.dumps(facts, option=orjson.OPT_INDENT_2)
         else:
-            content = json.dumps(facts, indent=2)
+            payload = json.dumps(facts, indent=2).encode('utf-8')
+
+        path.write_bytes(payload)
 
-        path.write_text(content, encoding='utf-8')
+        stat = path.stat()
+        self._cache[path] = ((stat.st_mtime_ns, stat.st_size), [dict(f) for f in facts])
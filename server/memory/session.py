@@ -11,9 +11,9 @@ Captures:
 
 import json
 import os
+import time
 from pathlib import Path
-from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Optional, Dict, List, Any
 import logging
 import hashlib
@@ -21,13 +21,47 @@ import hashlib
 try:
     import yaml
     HAS_YAML = True
+    # Use the libyaml C bindings when PyYAML was built with them
+    try:
+        from yaml import CSafeLoader as YamlLoader, CDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader, Dumper as YamlDumper
 except ImportError:
     HAS_YAML = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger('crucible.memory.session')
 
+# Last whole second formatted by _now(), as [epoch_second, "YYYY-MM-DDTHH:MM:SS"]
+_now_cache = [0, ""]
+
+
+def _now() -> str:
+    """
+    Current UTC time in the same format as ``datetime.utcnow().isoformat() + "Z"``.
 
-@dataclass
+    Decisions, problems and updates can arrive many times a second; the
+    date-and-time prefix is reused until the clock ticks over to the next
+    second, and only the microseconds are formatted per call.
+    """
+    now = time.time()
+    second = int(now)
+    if _now_cache[0] != second:
+        _now_cache[1] = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _now_cache[0] = second
+    micros = int((now - second) * 1_000_000)
+    # isoformat() leaves the fraction off entirely when it is zero
+    if micros:
+        return f"{_now_cache[1]}.{micros:06d}Z"
+    return _now_cache[1] + "Z"
+
+
+@dataclass(slots=True)
 class Decision:
     """A decision made during the session."""
     description: str
@@ -37,10 +71,19 @@ class Decision:
 
     def __post_init__(self):
         if not self.timestamp:
-            self.timestamp = datetime.utcnow().isoformat() + "Z"
+            self.timestamp = _now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for storage."""
+        return {
+            'description': self.description,
+            'reasoning': self.reasoning,
+            'timestamp': self.timestamp,
+            'context': dict(self.context),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Problem:
     """A problem encountered during the session."""
     description: str
@@ -50,10 +93,19 @@ class Problem:
 
     def __post_init__(self):
         if not self.timestamp:
-            self.timestamp = datetime.utcnow().isoformat() + "Z"
+            self.timestamp = _now()
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for storage."""
+        return {
+            'description': self.description,
+            'resolution': self.resolution,
+            'resolved': self.resolved,
+            'timestamp': self.timestamp,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class SessionState:
     """
     Complete state of a session.
@@ -93,21 +145,59 @@ class SessionState:
     user_preferences: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
-        now = datetime.utcnow().isoformat() + "Z"
-        if not self.started_at:
-            self.started_at = now
-        if not self.updated_at:
-            self.updated_at = now
+        # Resumed sessions already carry timestamps; skip the clock read
+        if not (self.started_at and self.updated_at):
+            now = _now()
+            if not self.started_at:
+                self.started_at = now
+            if not self.updated_at:
+                self.updated_at = now
         if not self.session_id:
             self.session_id = self._generate_id()
 
     def _generate_id(self) -> str:
         """Generate a unique session ID."""
         content = f"{self.started_at}:{self.project or 'none'}"
-        hash_val = hashlib.md5(content.encode()).hexdigest()[:8]
-        date_str = datetime.utcnow().strftime("%Y%m%d")
+        hash_val = hashlib.md5(content.encode()).digest()[:4].hex()
+        # Date part of started_at ("YYYY-MM-DD..."), rather than a second clock read
+        date_str = self.started_at[:10].replace('-', '')
         return f"sess_{date_str}_{hash_val}"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dict for storage.
+
+        Shallow: nested lists/dicts are shared with the session rather than
+        deep-copied like asdict() would, since the result is serialized at once.
+        """
+        return {
+            'session_id': self.session_id,
+            'started_at': self.started_at,
+            'updated_at': self.updated_at,
+            'project': self.project,
+            'project_path': self.project_path,
+            'primary_goal': self.primary_goal,
+            'files_read': self.files_read,
+            'files_modified': self.files_modified,
+            'files_created': self.files_created,
+            'decisions': self.decisions,
+            'problems': self.problems,
+            'tasks_completed': self.tasks_completed,
+            'tasks_pending': self.tasks_pending,
+            'current_task': self.current_task,
+            'key_insights': self.key_insights,
+            'codebase_notes': self.codebase_notes,
+            'user_preferences': self.user_preferences,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SessionState':
+        """Build from a stored dict, ignoring keys this version doesn't know."""
+        return cls(**{k: v for k, v in data.items() if k in _SESSION_FIELDS})
+
+
+_SESSION_FIELDS = frozenset(f.name for f in fields(SessionState))
+
 
 class SessionMemory:
     """
@@ -124,6 +214,9 @@ class SessionMemory:
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.current_session: Optional[SessionState] = None
         self._active_file: Optional[Path] = None
+        self._tmp_file: Optional[Path] = None
+        # (path, payload) of the last write, to skip rewriting identical content
+        self._last_saved: Optional[tuple] = None
 
     def start_session(
         self,
@@ -148,7 +241,7 @@ class SessionMemory:
             session = self._load_session(resume_from)
             if session:
                 self.current_session = session
-                self._active_file = self.base_path / f"{resume_from}.yaml"
+                self._set_active_file(resume_from)
                 logger.info(f"Resumed session: {resume_from}")
                 return session
             else:
@@ -160,8 +253,8 @@ class SessionMemory:
             project_path=project_path,
             primary_goal=goal
         )
-        self._active_file = self.base_path / f"{self.current_session.session_id}.yaml"
-        self._save()
+        self._set_active_file(self.current_session.session_id)
+        self._save(new_file=True)
 
         logger.info(f"Started session: {self.current_session.session_id}")
         return self.current_session
@@ -187,7 +280,7 @@ class SessionMemory:
             if hasattr(self.current_session, key):
                 setattr(self.current_session, key, value)
 
-        self.current_session.updated_at = datetime.utcnow().isoformat() + "Z"
+        self.current_session.updated_at = _now()
         self._save()
         return self.current_session
 
@@ -224,7 +317,7 @@ class SessionMemory:
             reasoning=reasoning,
             context=context or {}
         )
-        self.current_session.decisions.append(asdict(decision))
+        self.current_session.decisions.append(decision.to_dict())
         self._save()
 
     def record_problem(self, description: str, resolution: str = None):
@@ -236,7 +329,7 @@ class SessionMemory:
             resolution=resolution,
             resolved=resolution is not None
         )
-        self.current_session.problems.append(asdict(problem))
+        self.current_session.problems.append(problem.to_dict())
         self._save()
 
     def resolve_problem(self, problem_index: int, resolution: str):
@@ -256,6 +349,19 @@ class SessionMemory:
             self.current_session.key_insights.append(insight)
             self._save()
 
+    def add_insights(self, insights: List[str]):
+        """Add several insights, saving the session once."""
+        if not self.current_session:
+            return
+        key_insights = self.current_session.key_insights
+        added = False
+        for insight in insights:
+            if insight not in key_insights:
+                key_insights.append(insight)
+                added = True
+        if added:
+            self._save()
+
     def note_codebase(self, key: str, note: str):
         """Add a note about the codebase."""
         if not self.current_session:
@@ -330,11 +436,16 @@ class SessionMemory:
         # Move to archive
         archive_path = self.base_path / 'archive'
         archive_path.mkdir(exist_ok=True)
-        if self._active_file and self._active_file.exists():
-            self._active_file.rename(archive_path / self._active_file.name)
+        if self._active_file:
+            try:
+                self._active_file.replace(archive_path / self._active_file.name)
+            except FileNotFoundError:
+                pass
 
         self.current_session = None
         self._active_file = None
+        self._tmp_file = None
+        self._last_saved = None
 
         return "\n".join(summary_lines)
 
@@ -343,26 +454,40 @@ class SessionMemory:
         sessions = []
 
         # Active sessions
-        for f in self.base_path.glob("sess_*.yaml"):
+        for entry in self._scan_session_files(self.base_path):
             sessions.append({
-                'id': f.stem,
-                'path': str(f),
+                'id': entry.name[:-5],
+                'path': entry.path,
                 'archived': False
             })
 
         # Archived sessions
         if include_archived:
-            archive_path = self.base_path / 'archive'
-            if archive_path.exists():
-                for f in archive_path.glob("sess_*.yaml"):
-                    sessions.append({
-                        'id': f.stem,
-                        'path': str(f),
-                        'archived': True
-                    })
+            for entry in self._scan_session_files(self.base_path / 'archive'):
+                sessions.append({
+                    'id': entry.name[:-5],
+                    'path': entry.path,
+                    'archived': True
+                })
 
         return sessions
 
+    def _scan_session_files(self, directory: Path) -> List[os.DirEntry]:
+        """
+        Session files (sess_*.yaml) in a directory, as scandir entries.
+
+        DirEntry caches what readdir already reported, so callers can take
+        names and mtimes without a Path object and extra stat per file.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    e for e in entries
+                    if e.name.startswith('sess_') and e.name.endswith('.yaml')
+                ]
+        except FileNotFoundError:
+            return []
+
     def get_last_session(self, project: str = None) -> Optional[SessionState]:
         """
         Get the most recent session, optionally filtered by project.
@@ -373,59 +498,84 @@ class SessionMemory:
         Returns:
             Most recent SessionState or None
         """
-        sessions = []
+        best = None
+        for directory in (self.base_path, self.base_path / 'archive'):
+            for entry in self._scan_session_files(directory):
+                state = self._load_session_from_file(Path(entry.path))
+                if state and (project is None or state.project == project):
+                    if best is None or state.updated_at > best.updated_at:
+                        best = state
 
-        for f in list(self.base_path.glob("sess_*.yaml")) + \
-                 list((self.base_path / 'archive').glob("sess_*.yaml")):
-            state = self._load_session_from_file(f)
-            if state:
-                if project is None or state.project == project:
-                    sessions.append((state, f))
+        return best
 
-        if not sessions:
-            return None
-
-        # Sort by updated_at descending
-        sessions.sort(key=lambda x: x[0].updated_at, reverse=True)
-        return sessions[0][0]
+    def _save(self, new_file: bool = False):
+        """
+        Save current session to disk.
 
-    def _save(self):
-        """Save current session to disk."""
+        Args:
+            new_file: The session file doesn't exist yet, so there is no
+                previous state to protect and it can be written in place
+        """
         if not self.current_session or not self._active_file:
             return
 
-        data = asdict(self.current_session)
+        data = self.current_session.to_dict()
 
         if HAS_YAML:
-            content = yaml.dump(data, default_flow_style=False, sort_keys=False)
+            payload = yaml.dump(data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+        elif HAS_ORJSON:
+            # Compact: rewritten on every update and only ever machine-read
+            payload = orjson.dumps(data)
         else:
-            content = json.dumps(data, indent=2)
+            payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
 
-        self._active_file.write_text(content, encoding='utf-8')
+        # Calls that changed nothing (end_session's final save, re-noting the
+        # same value, re-adding a known task) would rewrite the same bytes
+        saved = (self._active_file, payload)
+        if self._last_saved == saved:
+            return
 
-    def _load_session(self, session_id: str) -> Optional[SessionState]:
-        """Load a session by ID."""
-        # Check active sessions
-        path = self.base_path / f"{session_id}.yaml"
-        if path.exists():
-            return self._load_session_from_file(path)
+        if new_file:
+            self._active_file.write_bytes(payload)
+            self._last_saved = saved
+            return
 
-        # Check archive
-        archive_path = self.base_path / 'archive' / f"{session_id}.yaml"
-        if archive_path.exists():
-            return self._load_session_from_file(archive_path)
+        # Swap in a complete file so a crash mid-write can't truncate the session
+        try:
+            self._tmp_file.write_bytes(payload)
+            os.replace(self._tmp_file, self._active_file)
+        except OSError:
+            self._tmp_file.unlink(missing_ok=True)
+            raise
+        self._last_saved = saved
+
+    def _set_active_file(self, session_id: str):
+        """Point saves at a session's file; the paths are fixed for its lifetime."""
+        self._active_file = self.base_path / f"{session_id}.yaml"
+        self._tmp_file = self.base_path / f"{session_id}.yaml.tmp"
+        self._last_saved = None
 
-        return None
+    def _load_session(self, session_id: str) -> Optional[SessionState]:
+        """Load a session by ID."""
+        # Check active sessions, then the archive
+        return (
+            self._load_session_from_file(self.base_path / f"{session_id}.yaml")
+            or self._load_session_from_file(self.base_path / 'archive' / f"{session_id}.yaml")
+        )
 
     def _load_session_from_file(self, path: Path) -> Optional[SessionState]:
         """Load session from a specific file."""
         try:
             content = path.read_text(encoding='utf-8')
             if HAS_YAML:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=YamlLoader)
+            elif HAS_ORJSON:
+                data = orjson.loads(content)
             else:
                 data = json.loads(content)
-            return SessionState(**data)
+            return SessionState.from_dict(data)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to load session from {path}: {e}")
             return None
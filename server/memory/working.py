@@ -8,10 +8,11 @@ Short-term memory for the current task:
 - Active hypotheses and approaches
 """
 
+import hashlib
 import json
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Optional, Dict, List, Any
 from collections import deque
 import logging
@@ -19,13 +20,24 @@ import logging
 try:
     import yaml
     HAS_YAML = True
+    # Use the libyaml C bindings when PyYAML was built with them
+    try:
+        from yaml import CSafeLoader as YamlLoader, CDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader, Dumper as YamlDumper
 except ImportError:
     HAS_YAML = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger('crucible.memory.working')
 
 
-@dataclass
+@dataclass(slots=True)
 class RecentItem:
     """A recently accessed item in working memory."""
     item_type: str  # file, output, result, thought
@@ -37,8 +49,17 @@ class RecentItem:
         if not self.timestamp:
             self.timestamp = datetime.utcnow().isoformat() + "Z"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for storage."""
+        return {
+            'item_type': self.item_type,
+            'content': self.content,
+            'timestamp': self.timestamp,
+            'relevance': self.relevance,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Hypothesis:
     """An active hypothesis or approach being considered."""
     description: str
@@ -47,8 +68,18 @@ class Hypothesis:
     evidence_against: List[str] = field(default_factory=list)
     status: str = "active"  # active, confirmed, rejected
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for storage."""
+        return {
+            'description': self.description,
+            'confidence': self.confidence,
+            'evidence_for': list(self.evidence_for),
+            'evidence_against': list(self.evidence_against),
+            'status': self.status,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class TaskContext:
     """
     Complete context for the current task.
@@ -84,9 +115,40 @@ class TaskContext:
         if not self.started_at:
             self.started_at = datetime.utcnow().isoformat() + "Z"
         if not self.task_id:
-            import hashlib
             content = f"{self.description}:{self.started_at}"
-            self.task_id = f"task_{hashlib.md5(content.encode()).hexdigest()[:8]}"
+            self.task_id = f"task_{hashlib.md5(content.encode()).digest()[:4].hex()}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dict for storage.
+
+        Shallow: nested lists/dicts are shared with the context rather than
+        deep-copied like asdict() would, since the result is serialized at once.
+        """
+        return {
+            'task_id': self.task_id,
+            'description': self.description,
+            'started_at': self.started_at,
+            'relevant_files': self.relevant_files,
+            'relevant_functions': self.relevant_functions,
+            'relevant_concepts': self.relevant_concepts,
+            'recent_reads': self.recent_reads,
+            'recent_outputs': self.recent_outputs,
+            'recent_errors': self.recent_errors,
+            'hypotheses': self.hypotheses,
+            'current_approach': self.current_approach,
+            'blockers': self.blockers,
+            'notes': self.notes,
+            'dependencies': self.dependencies,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TaskContext':
+        """Build from a stored dict, ignoring keys this version doesn't know."""
+        return cls(**{k: v for k, v in data.items() if k in _TASK_CONTEXT_FIELDS})
+
+
+_TASK_CONTEXT_FIELDS = frozenset(f.name for f in fields(TaskContext))
 
 
 class WorkingMemory:
@@ -110,6 +172,8 @@ class WorkingMemory:
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.current_context: Optional[TaskContext] = None
         self._context_file: Optional[Path] = None
+        # (path, payload) of the last write, to skip rewriting identical content
+        self._last_saved: Optional[tuple] = None
 
     def start_task(self, description: str, relevant_files: List[str] = None) -> TaskContext:
         """
@@ -151,16 +215,19 @@ class WorkingMemory:
             TaskContext if found
         """
         path = self.base_path / f"{task_id}.yaml"
-        if not path.exists():
+        try:
+            content = path.read_text(encoding='utf-8')
+        except FileNotFoundError:
             return None
 
-        content = path.read_text(encoding='utf-8')
         if HAS_YAML:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YamlLoader)
+        elif HAS_ORJSON:
+            data = orjson.loads(content)
         else:
             data = json.loads(content)
 
-        self.current_context = TaskContext(**data)
+        self.current_context = TaskContext.from_dict(data)
         self._context_file = path
         return self.current_context
 
@@ -188,27 +255,32 @@ class WorkingMemory:
             self.current_context.relevant_concepts.append(concept)
             self._save()
 
-    def record_read(self, file_path: str, summary: str = None):
+    def record_read(self, file_path: str, summary: str = None, relevant: bool = False):
         """
         Record that a file was read.
 
         Args:
             file_path: Path to file
             summary: Optional summary of what was found
+            relevant: Also mark the file relevant to the task (one save for both)
         """
         if not self.current_context:
             return
 
+        if relevant and file_path not in self.current_context.relevant_files:
+            self.current_context.relevant_files.append(file_path)
+
         item = RecentItem(
             item_type='file',
             content={'path': file_path, 'summary': summary}
         )
 
-        self.current_context.recent_reads.append(asdict(item))
+        recent = self.current_context.recent_reads
+        recent.append(item.to_dict())
 
-        # Ring buffer behavior
-        if len(self.current_context.recent_reads) > self.MAX_RECENT_ITEMS:
-            self.current_context.recent_reads = self.current_context.recent_reads[-self.MAX_RECENT_ITEMS:]
+        # Ring buffer behavior (trimmed in place, no list copy)
+        if len(recent) > self.MAX_RECENT_ITEMS:
+            del recent[:-self.MAX_RECENT_ITEMS]
 
         self._save()
 
@@ -233,10 +305,11 @@ class WorkingMemory:
             content={'command': command, 'output': output, 'success': success}
         )
 
-        self.current_context.recent_outputs.append(asdict(item))
+        recent = self.current_context.recent_outputs
+        recent.append(item.to_dict())
 
-        if len(self.current_context.recent_outputs) > self.MAX_RECENT_ITEMS:
-            self.current_context.recent_outputs = self.current_context.recent_outputs[-self.MAX_RECENT_ITEMS:]
+        if len(recent) > self.MAX_RECENT_ITEMS:
+            del recent[:-self.MAX_RECENT_ITEMS]
 
         self._save()
 
@@ -256,10 +329,11 @@ class WorkingMemory:
             content={'error': error, 'context': context}
         )
 
-        self.current_context.recent_errors.append(asdict(item))
+        recent = self.current_context.recent_errors
+        recent.append(item.to_dict())
 
-        if len(self.current_context.recent_errors) > self.MAX_RECENT_ITEMS:
-            self.current_context.recent_errors = self.current_context.recent_errors[-self.MAX_RECENT_ITEMS:]
+        if len(recent) > self.MAX_RECENT_ITEMS:
+            del recent[:-self.MAX_RECENT_ITEMS]
 
         self._save()
 
@@ -278,7 +352,7 @@ class WorkingMemory:
             return -1
 
         hypothesis = Hypothesis(description=description, confidence=confidence)
-        self.current_context.hypotheses.append(asdict(hypothesis))
+        self.current_context.hypotheses.append(hypothesis.to_dict())
         self._save()
 
         return len(self.current_context.hypotheses) - 1
@@ -452,8 +526,11 @@ class WorkingMemory:
         # Archive the task
         archive_path = self.base_path / 'completed'
         archive_path.mkdir(exist_ok=True)
-        if self._context_file and self._context_file.exists():
-            self._context_file.rename(archive_path / self._context_file.name)
+        if self._context_file:
+            try:
+                self._context_file.replace(archive_path / self._context_file.name)
+            except FileNotFoundError:
+                pass
 
         self.current_context = None
         self._context_file = None
@@ -465,11 +542,20 @@ class WorkingMemory:
         if not self.current_context or not self._context_file:
             return
 
-        data = asdict(self.current_context)
+        data = self.current_context.to_dict()
 
         if HAS_YAML:
-            content = yaml.dump(data, default_flow_style=False, sort_keys=False)
+            payload = yaml.dump(data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+        elif HAS_ORJSON:
+            # Compact: rewritten on every update and only ever machine-read
+            payload = orjson.dumps(data)
         else:
-            content = json.dumps(data, indent=2)
+            payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+        # Re-saving an unchanged context (e.g. start_task flushing the previous
+        # one) would rewrite the same bytes; skip the write
+        if self._last_saved == (self._context_file, payload):
+            return
 
-        self._context_file.write_text(content, encoding='utf-8')
+        self._context_file.write_bytes(payload)
+        self._last_saved = (self._context_file, payload)
@@ -11,6 +11,12 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger('crucible.fixtures')
 
 
@@ -32,6 +38,11 @@ class FixtureStore:
 
     def __init__(self, base_path: Path):
         self.base_path = Path(base_path)
+        # Metadata descriptions for listings: meta path -> (mtime_ns, description)
+        self._descriptions: Dict[Path, tuple] = {}
+        # Category each fixture name was last seen in (a hint for lookups
+        # without a category; verified by the read itself)
+        self._locations: Dict[str, str] = {}
         self._ensure_directories()
 
     def _ensure_directories(self):
@@ -61,11 +72,16 @@ class FixtureStore:
         # Save content
         content_path = category_path / f"{name}.txt"
         content_path.write_text(content, encoding='utf-8')
+        self._locations[name] = category
 
         # Save metadata
+        meta_path = category_path / f"{name}.meta.json"
+        self._descriptions.pop(meta_path, None)
         if metadata:
-            meta_path = category_path / f"{name}.meta.json"
-            meta_path.write_text(json.dumps(metadata, indent=2), encoding='utf-8')
+            if HAS_ORJSON:
+                meta_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            else:
+                meta_path.write_text(json.dumps(metadata, indent=2), encoding='utf-8')
 
         logger.info(f"Saved fixture: {category}/{name}")
 
@@ -86,17 +102,27 @@ class FixtureStore:
         """
         # If category specified, look there
         if category:
-            content_path = self.base_path / category / f"{name}.txt"
-            if content_path.exists():
-                return content_path.read_text(encoding='utf-8')
-            return f"Fixture not found: {category}/{name}"
+            try:
+                return (self.base_path / category / f"{name}.txt").read_text(encoding='utf-8')
+            except FileNotFoundError:
+                return f"Fixture not found: {category}/{name}"
+
+        # Try where this fixture was last seen before searching every category
+        known = self._locations.get(name)
+        if known:
+            try:
+                return (self.base_path / known / f"{name}.txt").read_text(encoding='utf-8')
+            except FileNotFoundError:
+                del self._locations[name]
 
         # Search all categories
         for cat_dir in self.base_path.iterdir():
-            if cat_dir.is_dir():
-                content_path = cat_dir / f"{name}.txt"
-                if content_path.exists():
-                    return content_path.read_text(encoding='utf-8')
+            try:
+                content = (cat_dir / f"{name}.txt").read_text(encoding='utf-8')
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            self._locations[name] = cat_dir.name
+            return content
 
         return f"Fixture not found: {name}"
 
@@ -107,9 +133,32 @@ class FixtureStore:
     ) -> Optional[Dict[str, Any]]:
         """Get fixture metadata."""
         meta_path = self.base_path / category / f"{name}.meta.json"
-        if meta_path.exists():
-            return json.loads(meta_path.read_text(encoding='utf-8'))
-        return None
+        try:
+            data = meta_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+    def _get_description(self, name: str, category: str, mtime: Optional[int]) -> str:
+        """
+        Get a fixture's description, re-reading metadata only when it changes.
+
+        Args:
+            name: Fixture name
+            category: Category directory
+            mtime: st_mtime_ns of the metadata file, or None if it has none
+        """
+        meta_path = self.base_path / category / f"{name}.meta.json"
+        if mtime is None:
+            self._descriptions.pop(meta_path, None)
+            return ""
+
+        cached = self._descriptions.get(meta_path)
+        if cached is None or cached[0] != mtime:
+            meta = self.get_metadata(name, category)
+            cached = (mtime, (meta or {}).get("description") or "")
+            self._descriptions[meta_path] = cached
+        return cached[1]
 
     def list_fixtures(self, category: str = None) -> str:
         """
@@ -123,27 +172,33 @@ class FixtureStore:
         """
         lines = ["=== Available Fixtures ===", ""]
 
-        categories = [category] if category else [
-            d.name for d in self.base_path.iterdir() if d.is_dir()
-        ]
+        if category:
+            categories = [category]
+        else:
+            with os.scandir(self.base_path) as entries:
+                categories = [e.name for e in entries if e.is_dir()]
 
         total = 0
         for cat in sorted(categories):
-            cat_path = self.base_path / cat
-            if not cat_path.exists():
+            # One directory pass yields fixture names and metadata mtimes
+            fixtures = []
+            meta_mtimes = {}
+            try:
+                with os.scandir(self.base_path / cat) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.meta.json'):
+                            meta_mtimes[entry.name[:-len('.meta.json')]] = entry.stat().st_mtime_ns
+                        elif entry.name.endswith('.txt'):
+                            fixtures.append(entry.name[:-len('.txt')])
+            except (FileNotFoundError, NotADirectoryError):
                 continue
 
-            fixtures = [
-                f.stem for f in cat_path.glob("*.txt")
-            ]
-
             if fixtures:
                 lines.append(f"{cat}/")
                 for name in sorted(fixtures):
-                    meta = self.get_metadata(name, cat)
-                    desc = ""
-                    if meta and meta.get("description"):
-                        desc = f" - {meta['description'][:50]}"
+                    desc = self._get_description(name, cat, meta_mtimes.get(name))
+                    if desc:
+                        desc = f" - {desc[:50]}"
                     lines.append(f"  {name}{desc}")
                     total += 1
                 lines.append("")
@@ -159,12 +214,16 @@ class FixtureStore:
         content_path = self.base_path / category / f"{name}.txt"
         meta_path = self.base_path / category / f"{name}.meta.json"
 
-        deleted = False
-        if content_path.exists():
+        self._descriptions.pop(meta_path, None)
+        if self._locations.get(name) == category:
+            del self._locations[name]
+
+        try:
             content_path.unlink()
             deleted = True
-        if meta_path.exists():
-            meta_path.unlink()
+        except FileNotFoundError:
+            deleted = False
+        meta_path.unlink(missing_ok=True)
 
         return deleted
 
@@ -4,24 +4,37 @@ Learnings Store - Persistent knowledge base.
 Stores learnings in YAML files organized by topic.
 """
 
+import hashlib
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 import logging
 
 try:
     import yaml
     HAS_YAML = True
+    # Use the libyaml C bindings when PyYAML was built with them
+    try:
+        from yaml import CSafeLoader as YamlLoader, CDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader, Dumper as YamlDumper
 except ImportError:
     HAS_YAML = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger('crucible.learnings')
 
 
-@dataclass
+@dataclass(slots=True)
 class Learning:
     """A single learning entry."""
     topic: str
@@ -34,19 +47,31 @@ class Learning:
     id: str = ""
 
     def __post_init__(self):
-        now = datetime.utcnow().isoformat() + "Z"
-        if not self.created_at:
-            self.created_at = now
-        if not self.updated_at:
-            self.updated_at = now
+        # Topics repeat across every entry in a file; share one string object
+        if isinstance(self.topic, str):
+            self.topic = sys.intern(self.topic)
+        # Entries loaded from disk already carry timestamps; skip the clock read
+        if not (self.created_at and self.updated_at):
+            now = datetime.utcnow().isoformat() + "Z"
+            if not self.created_at:
+                self.created_at = now
+            if not self.updated_at:
+                self.updated_at = now
         if not self.id:
-            import hashlib
             # Create deterministic ID from content
             content_hash = hashlib.md5(
                 f"{self.topic}:{self.title}".encode()
-            ).hexdigest()[:8]
+            ).digest()[:4].hex()
             self.id = f"{self.topic[:3]}_{content_hash}"
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Learning':
+        """Build from a stored dict, ignoring keys this version doesn't know."""
+        return cls(**{k: v for k, v in data.items() if k in _LEARNING_FIELDS})
+
+
+_LEARNING_FIELDS = frozenset(f.name for f in fields(Learning))
+
 
 class LearningsStore:
     """
@@ -68,6 +93,9 @@ class LearningsStore:
         self.base_path.mkdir(parents=True, exist_ok=True)
         (self.base_path / 'projects').mkdir(exist_ok=True)
 
+        # Parsed file contents, keyed by path and validated by (mtime, size)
+        self._cache: Dict[Path, tuple] = {}
+
     def save(self, learning: Learning):
         """
         Save a learning.
@@ -126,6 +154,7 @@ class LearningsStore:
             List of matching Learning objects
         """
         all_learnings = self._load_all()
+        search_lower = search.lower() if search else None
         results = []
 
         for l in all_learnings:
@@ -142,13 +171,12 @@ class LearningsStore:
                 continue
 
             # Search filter
-            if search:
-                search_lower = search.lower()
+            if search_lower:
                 if (search_lower not in l.get('title', '').lower() and
                     search_lower not in l.get('content', '').lower()):
                     continue
 
-            results.append(Learning(**l))
+            results.append(Learning.from_dict(l))
 
         # Sort by created_at descending
         results.sort(key=lambda x: x.created_at, reverse=True)
@@ -179,14 +207,33 @@ class LearningsStore:
         return projects
 
     def _load_file(self, path: Path) -> List[Dict]:
-        """Load learnings from a single file."""
-        if not path.exists():
+        """
+        Load learnings from a single file.
+
+        Parsed contents are cached until the file changes on disk, so every
+        search doesn't re-parse every topic file. Callers get fresh dicts.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return []
 
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(path)
+        if cached is None or cached[0] != key:
+            cached = (key, self._parse_file(path))
+            self._cache[path] = cached
+
+        return [dict(l) for l in cached[1]]
+
+    def _parse_file(self, path: Path) -> List[Dict]:
+        """Parse a learnings file from disk."""
         content = path.read_text(encoding='utf-8')
 
         if HAS_YAML:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YamlLoader)
+        elif HAS_ORJSON:
+            data = orjson.loads(content)
         else:
             # Fallback to JSON
             data = json.loads(content)
@@ -198,33 +245,42 @@ class LearningsStore:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         if HAS_YAML:
-            content = yaml.dump(learnings, default_flow_style=False, sort_keys=False)
+            payload = yaml.dump(learnings, Dumper=YamlDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+        elif HAS_ORJSON:
+            payload = orjson.dumps(learnings, option=orjson.OPT_INDENT_2)
         else:
-            content = json.dumps(learnings, indent=2)
+            payload = json.dumps(learnings, indent=2).encode('utf-8')
 
-        path.write_text(content, encoding='utf-8')
+        path.write_bytes(payload)
+
+        stat = path.stat()
+        self._cache[path] = ((stat.st_mtime_ns, stat.st_size), [dict(l) for l in learnings])
 
     def _load_all(self) -> List[Dict]:
         """Load all learnings from all files."""
         all_learnings = []
-
-        # Load topic files
-        for yaml_file in self.base_path.glob("*.yaml"):
+        for yaml_file in self._learning_files():
             all_learnings.extend(self._load_file(yaml_file))
-
-        # Load project files
-        projects_dir = self.base_path / 'projects'
-        if projects_dir.exists():
-            for yaml_file in projects_dir.glob("*.yaml"):
-                all_learnings.extend(self._load_file(yaml_file))
-
         return all_learnings
 
+    def _learning_files(self) -> List[Path]:
+        """Topic files, then project files, each directory listed with os.scandir."""
+        files = []
+        for directory in (self.base_path, self.base_path / 'projects'):
+            try:
+                with os.scandir(directory) as entries:
+                    files.extend(
+                        Path(e.path) for e in entries
+                        if e.name.endswith('.yaml') and e.is_file()
+                    )
+            except FileNotFoundError:
+                continue
+        return files
+
     def delete(self, learning_id: str) -> bool:
         """Delete a learning by ID."""
         # Search all files for the learning
-        for yaml_file in list(self.base_path.glob("*.yaml")) + \
-                         list((self.base_path / 'projects').glob("*.yaml")):
+        for yaml_file in self._learning_files():
             learnings = self._load_file(yaml_file)
             original_len = len(learnings)
 
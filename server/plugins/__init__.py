@@ -11,12 +11,19 @@ Plugins are hot-loadable - add/remove files to enable/disable tools.
 import os
 import sys
 import json
+import functools
 import importlib
 import importlib.util
 from pathlib import Path
 from typing import Dict, List, Any, Callable, Optional
 import logging
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger('crucible.plugins')
 
 PLUGINS_DIR = Path(__file__).parent
@@ -31,25 +38,52 @@ class PluginManager:
         self.tools: List[Any] = []  # Tool definitions
         self.handlers: Dict[str, Callable] = {}  # tool_name -> handler
         self.config = self._load_config()
+        self._dirty = False  # config changed since last save
 
     def _load_config(self) -> Dict:
         """Load plugin configuration."""
-        if CONFIG_FILE.exists():
-            try:
-                with open(CONFIG_FILE) as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load plugin config: {e}")
+        try:
+            data = CONFIG_FILE.read_bytes()
+            return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to load plugin config: {e}")
         return {"enabled": {}, "settings": {}}
 
     def _save_config(self):
-        """Save plugin configuration."""
+        """Save plugin configuration (atomically, so a crash can't truncate it)."""
+        tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if HAS_ORJSON:
+                payload = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.config, indent=2).encode('utf-8')
+
+            # No existing config to protect on the first save
+            if not CONFIG_FILE.exists():
+                CONFIG_FILE.write_bytes(payload)
+                return
+
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, CONFIG_FILE)
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             logger.error(f"Failed to save plugin config: {e}")
 
+    def _set_enabled(self, name: str, enabled: bool):
+        """Record a plugin's enabled state, marking the config dirty on change."""
+        if self.config.setdefault('enabled', {}).get(name) != enabled:
+            self.config['enabled'][name] = enabled
+            self._dirty = True
+
+    def flush(self):
+        """Save the configuration if it changed since the last save."""
+        if self._dirty:
+            self._save_config()
+            self._dirty = False
+
     def discover_plugins(self) -> List[str]:
         """Find all available plugins."""
         plugins = []
@@ -59,7 +93,7 @@ class PluginManager:
             plugins.append(path.stem)
         return plugins
 
-    def load_plugin(self, name: str) -> bool:
+    def load_plugin(self, name: str, flush: bool = True) -> bool:
         """Load a plugin by name."""
         if name in self.plugins:
             logger.info(f"Plugin {name} already loaded")
@@ -91,8 +125,9 @@ class PluginManager:
                 module.init(settings)
 
             self.plugins[name] = module
-            self.config['enabled'][name] = True
-            self._save_config()
+            self._set_enabled(name, True)
+            if flush:
+                self.flush()
 
             logger.info(f"Loaded plugin: {name}")
             return True
@@ -101,7 +136,7 @@ class PluginManager:
             logger.exception(f"Failed to load plugin {name}: {e}")
             return False
 
-    def unload_plugin(self, name: str) -> bool:
+    def unload_plugin(self, name: str, flush: bool = True) -> bool:
         """Unload a plugin by name."""
         if name not in self.plugins:
             logger.warning(f"Plugin {name} not loaded")
@@ -124,8 +159,9 @@ class PluginManager:
             del self.plugins[name]
             del sys.modules[f"crucible_plugin_{name}"]
 
-            self.config['enabled'][name] = False
-            self._save_config()
+            self._set_enabled(name, False)
+            if flush:
+                self.flush()
 
             logger.info(f"Unloaded plugin: {name}")
             return True
@@ -136,14 +172,17 @@ class PluginManager:
 
     def reload_plugin(self, name: str) -> bool:
         """Reload a plugin (unload + load)."""
-        self.unload_plugin(name)
-        return self.load_plugin(name)
+        self.unload_plugin(name, flush=False)
+        loaded = self.load_plugin(name, flush=False)
+        self.flush()
+        return loaded
 
     def load_enabled_plugins(self):
         """Load all plugins marked as enabled in config."""
-        for name, enabled in self.config.get('enabled', {}).items():
+        for name, enabled in list(self.config.get('enabled', {}).items()):
             if enabled:
-                self.load_plugin(name)
+                self.load_plugin(name, flush=False)
+        self.flush()
 
     def get_tools(self) -> List[Any]:
         """Get all registered tools from plugins."""
@@ -151,10 +190,10 @@ class PluginManager:
 
     async def handle_tool(self, name: str, args: Dict[str, Any]) -> Optional[str]:
         """Handle a tool call if it's from a plugin."""
-        if name in self.handlers:
-            handler = self.handlers[name]
-            return await handler(args)
-        return None
+        handler = self.handlers.get(name)
+        if handler is None:
+            return None
+        return await handler(args)
 
     def status(self) -> str:
         """Get plugin system status."""
@@ -178,11 +217,7 @@ class PluginManager:
 
 
 # Singleton instance
-_manager: Optional[PluginManager] = None
-
+@functools.lru_cache(maxsize=1)
 def get_plugin_manager() -> PluginManager:
     """Get the plugin manager singleton."""
-    global _manager
-    if _manager is None:
-        _manager = PluginManager()
-    return _manager
+    return PluginManager()
@@ -9,6 +9,8 @@ Provides tools for:
 Enable by adding to plugins.json or calling crucible_plugin_load("devops")
 """
 
+import asyncio
+import functools
 import os
 import subprocess
 import shutil
@@ -16,6 +18,13 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger('crucible.plugins.devops')
 
@@ -39,6 +48,25 @@ CONFIG = {
     "max_file_size_mb": 10,
 }
 
+# Blocking docker/shell/file calls run on a small dedicated pool, so a slow
+# `docker compose up` can't starve the server's shared default executor
+MAX_WORKERS = 4
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the plugin's thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="crucible-devops")
+    return _executor
+
+
+async def _in_pool(func, *args, **kwargs):
+    """Run a blocking call on the plugin's thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
 
 def init(settings: Dict[str, Any]):
     """Initialize plugin with settings from plugins.json."""
@@ -49,6 +77,10 @@ def init(settings: Dict[str, Any]):
 
 def cleanup():
     """Cleanup when plugin is unloaded."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
     logger.info("DevOps plugin unloaded")
 
 
@@ -70,7 +102,7 @@ async def docker_ps(args: Dict[str, Any]) -> str:
             cmd.append("-a")
         cmd.extend(["--format", format_str])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = await _in_pool(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -98,7 +130,7 @@ async def docker_logs(args: Dict[str, Any]) -> str:
         tail = args.get("tail", 100)
         cmd = ["docker", "logs", "--tail", str(tail), container]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = await _in_pool(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
 
         output = result.stdout + result.stderr
         return f"=== Logs: {container} (last {tail} lines) ===\n{output}"
@@ -125,7 +157,7 @@ async def docker_exec(args: Dict[str, Any]) -> str:
 
     try:
         cmd = ["docker", "exec", container, "sh", "-c", command]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        result = await _in_pool(subprocess.run, cmd, capture_output=True, text=True, timeout=60)
 
         output = result.stdout + result.stderr
         status = "SUCCESS" if result.returncode == 0 else f"FAILED (exit {result.returncode})"
@@ -174,7 +206,7 @@ async def docker_compose(args: Dict[str, Any]) -> str:
         if service:
             cmd.append(service)
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        result = await _in_pool(subprocess.run, cmd, capture_output=True, text=True, timeout=120)
 
         output = result.stdout + result.stderr
         status = "SUCCESS" if result.returncode == 0 else f"FAILED (exit {result.returncode})"
@@ -198,13 +230,13 @@ async def docker_inspect(args: Dict[str, Any]) -> str:
 
     try:
         cmd = ["docker", "inspect", target]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = await _in_pool(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
 
         # Parse and format key info
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout) if HAS_ORJSON else json.loads(result.stdout)
         if data:
             info = data[0]
             summary = {
@@ -216,7 +248,11 @@ async def docker_inspect(args: Dict[str, Any]) -> str:
                 "Mounts": [m.get("Source", "") + " -> " + m.get("Destination", "")
                           for m in info.get("Mounts", [])],
             }
-            return f"=== Docker Inspect: {target} ===\n{json.dumps(summary, indent=2)}"
+            if HAS_ORJSON:
+                formatted = orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode()
+            else:
+                formatted = json.dumps(summary, indent=2)
+            return f"=== Docker Inspect: {target} ===\n{formatted}"
 
         return result.stdout
 
@@ -234,8 +270,8 @@ def _is_path_allowed(path: str) -> bool:
     return any(path.startswith(allowed) for allowed in CONFIG["allowed_paths"])
 
 
-async def file_read(args: Dict[str, Any]) -> str:
-    """Read a file."""
+def _read_file(args: Dict[str, Any]) -> str:
+    """Read a file (blocking; called off the event loop)."""
     path = args.get("path")
     if not path:
         return "Error: path required"
@@ -251,16 +287,18 @@ async def file_read(args: Dict[str, Any]) -> str:
         if not path_obj.is_file():
             return f"Error: Not a file: {path}"
 
-        size_mb = path_obj.stat().st_size / (1024 * 1024)
+        size_bytes = path_obj.stat().st_size
+        size_mb = size_bytes / (1024 * 1024)
         if size_mb > CONFIG["max_file_size_mb"]:
             return f"Error: File too large ({size_mb:.1f}MB > {CONFIG['max_file_size_mb']}MB)"
 
-        content = path_obj.read_text()
-
-        # Truncate if too long
+        # Read only what will be returned (one extra char detects truncation)
         max_chars = args.get("max_chars", 50000)
+        with open(path_obj) as f:
+            content = f.read(max_chars + 1)
+
         if len(content) > max_chars:
-            content = content[:max_chars] + f"\n\n... [truncated, {len(content)} total chars]"
+            content = content[:max_chars] + f"\n\n... [truncated, {size_bytes} total bytes]"
 
         return f"=== {path} ===\n{content}"
 
@@ -268,8 +306,13 @@ async def file_read(args: Dict[str, Any]) -> str:
         return f"Error reading file: {str(e)}"
 
 
-async def file_write(args: Dict[str, Any]) -> str:
-    """Write to a file."""
+async def file_read(args: Dict[str, Any]) -> str:
+    """Read a file."""
+    return await _in_pool(_read_file, args)
+
+
+def _write_file(args: Dict[str, Any]) -> str:
+    """Write to a file (blocking; called off the event loop)."""
     path = args.get("path")
     content = args.get("content")
 
@@ -299,8 +342,13 @@ async def file_write(args: Dict[str, Any]) -> str:
         return f"Error writing file: {str(e)}"
 
 
-async def file_list(args: Dict[str, Any]) -> str:
-    """List directory contents."""
+async def file_write(args: Dict[str, Any]) -> str:
+    """Write to a file."""
+    return await _in_pool(_write_file, args)
+
+
+def _list_dir(args: Dict[str, Any]) -> str:
+    """List directory contents (blocking; called off the event loop)."""
     path = args.get("path", ".")
 
     if not _is_path_allowed(path):
@@ -330,6 +378,11 @@ async def file_list(args: Dict[str, Any]) -> str:
         return f"Error listing directory: {str(e)}"
 
 
+async def file_list(args: Dict[str, Any]) -> str:
+    """List directory contents."""
+    return await _in_pool(_list_dir, args)
+
+
 # =============================================================================
 # SHELL TOOLS
 # =============================================================================
@@ -353,7 +406,8 @@ async def shell_exec(args: Dict[str, Any]) -> str:
     try:
         timeout = min(args.get("timeout", 30), 120)  # Max 2 minutes
 
-        result = subprocess.run(
+        result = await _in_pool(
+            subprocess.run,
             command,
             shell=True,
             capture_output=True,
@@ -377,6 +431,11 @@ async def shell_exec(args: Dict[str, Any]) -> str:
 # TOOL DEFINITIONS
 # =============================================================================
 
+# Property schemas shared by several tools (never mutated)
+_CONTAINER_PROP = {"type": "string", "description": "Container name or ID"}
+_COMMAND_PROP = {"type": "string", "description": "Command to execute"}
+_FILE_PATH_PROP = {"type": "string", "description": "Path to file"}
+
 TOOLS = [
     Tool(
         name="crucible_docker_ps",
@@ -403,10 +462,7 @@ TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "container": {
-                    "type": "string",
-                    "description": "Container name or ID"
-                },
+                "container": _CONTAINER_PROP,
                 "tail": {
                     "type": "integer",
                     "description": "Number of lines to show",
@@ -422,14 +478,8 @@ TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "container": {
-                    "type": "string",
-                    "description": "Container name or ID"
-                },
-                "command": {
-                    "type": "string",
-                    "description": "Command to execute"
-                }
+                "container": _CONTAINER_PROP,
+                "command": _COMMAND_PROP
             },
             "required": ["container", "command"]
         }
@@ -478,10 +528,7 @@ TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "path": {
-                    "type": "string",
-                    "description": "Path to file"
-                },
+                "path": _FILE_PATH_PROP,
                 "max_chars": {
                     "type": "integer",
                     "description": "Maximum characters to return",
@@ -497,10 +544,7 @@ TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "path": {
-                    "type": "string",
-                    "description": "Path to file"
-                },
+                "path": _FILE_PATH_PROP,
                 "content": {
                     "type": "string",
                     "description": "Content to write"
@@ -534,10 +578,7 @@ TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "command": {
-                    "type": "string",
-                    "description": "Command to execute"
-                },
+                "command": _COMMAND_PROP,
                 "cwd": {
                     "type": "string",
                     "description": "Working directory",
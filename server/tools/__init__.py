@@ -1,11 +1,32 @@
 # Crucible Tools
 """
 MCP tool implementations for code execution, verification, and learning.
+
+Exports are resolved lazily (PEP 562), so importing one submodule such as
+``server.tools.memory`` doesn't drag in every other tool module.
 """
 
-from .execute import ExecutionTool
-from .verify import VerificationTool
-from .capture import CaptureTool
-from .learn import LearningsTool
+import importlib
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    'ExecutionTool': 'execute',
+    'VerificationTool': 'verify',
+    'CaptureTool': 'capture',
+    'LearningsTool': 'learn',
+}
 
 __all__ = ['ExecutionTool', 'VerificationTool', 'CaptureTool', 'LearningsTool']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module('.' + _LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
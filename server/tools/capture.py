@@ -23,6 +23,8 @@ class CaptureTool:
     - Documentation of expected formats
     """
 
+    MAX_CONCURRENT_CAPTURES = 4
+
     def __init__(self, fixture_store: FixtureStore):
         self.fixture_store = fixture_store
         self.executor = ExecutionTool(docker_available=False)  # Direct execution for captures
@@ -71,7 +73,8 @@ class CaptureTool:
             metadata=metadata
         )
 
-        lines_count = len(result.stdout.strip().split('\n'))
+        # Count newlines rather than splitting large captures into a list of lines
+        lines_count = result.stdout.strip().count('\n') + 1
         return f"Captured '{name}' in {category}/ ({lines_count} lines, {len(result.stdout)} bytes)"
 
     async def capture_multiple(
@@ -89,14 +92,21 @@ class CaptureTool:
         Returns:
             Status summary
         """
-        results = []
-
-        for name, command in commands.items():
-            try:
-                msg = await self.capture(command, name, category)
-                results.append(f"✓ {name}: {msg}")
-            except Exception as e:
-                results.append(f"✗ {name}: {str(e)}")
+        # Commands are independent, so overlap them (bounded) instead of
+        # waiting on each subprocess in turn; output order is preserved
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CAPTURES)
+
+        async def capture_one(name: str, command: str) -> str:
+            async with semaphore:
+                try:
+                    msg = await self.capture(command, name, category)
+                    return f"✓ {name}: {msg}"
+                except Exception as e:
+                    return f"✗ {name}: {str(e)}"
+
+        results = await asyncio.gather(
+            *(capture_one(name, command) for name, command in commands.items())
+        )
 
         return "\n".join(results)
 
@@ -8,15 +8,19 @@ import tempfile
 import os
 import json
 import shutil
+import time
+from types import MappingProxyType
 from typing import Optional
 from pathlib import Path
 from dataclasses import dataclass
 import logging
 
+from ..maintenance.docker_cleanup import check_docker
+
 logger = logging.getLogger('crucible.execute')
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of code execution."""
     success: bool
@@ -57,47 +61,47 @@ class ExecutionTool:
     """
 
     # Docker images for isolated execution
-    DOCKER_IMAGES = {
+    DOCKER_IMAGES = MappingProxyType({
         "python": "python:3.11-slim",
         "bash": "ubuntu:22.04",
         "javascript": "node:20-slim",
         "go": "golang:1.21-alpine",
-    }
+    })
 
     # File extensions
-    EXTENSIONS = {
+    EXTENSIONS = MappingProxyType({
         "python": ".py",
         "bash": ".sh",
         "javascript": ".js",
         "go": ".go",
-    }
+    })
 
     # Execution commands
-    COMMANDS = {
-        "python": ["python"],
-        "bash": ["bash"],
-        "javascript": ["node"],
-        "go": ["go", "run"],
-    }
+    COMMANDS = MappingProxyType({
+        "python": ("python",),
+        "bash": ("bash",),
+        "javascript": ("node",),
+        "go": ("go", "run"),
+    })
 
     def __init__(self, docker_available: Optional[bool] = None):
         """Initialize execution tool."""
-        if docker_available is None:
-            self.docker_available = self._check_docker()
-        else:
-            self.docker_available = docker_available
-
-    def _check_docker(self) -> bool:
-        """Check if Docker is available."""
-        try:
-            result = subprocess.run(
-                ["docker", "version"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        # None means "probe on first isolated run"
+        self._docker_available = docker_available
+        self._warned_no_docker = False
+
+    @property
+    def docker_available(self) -> bool:
+        """Whether Docker can be used for isolated execution."""
+        if self._docker_available is None:
+            self._docker_available = check_docker()
+        return self._docker_available
+
+    async def _docker_ready(self) -> bool:
+        """docker_available for async callers; the first probe runs off the event loop."""
+        if self._docker_available is None:
+            self._docker_available = await asyncio.to_thread(check_docker)
+        return self._docker_available
 
     async def execute(
         self,
@@ -121,11 +125,13 @@ class ExecutionTool:
         if language not in self.COMMANDS:
             return f"Unsupported language: {language}. Supported: {list(self.COMMANDS.keys())}"
 
-        if isolated and self.docker_available:
+        if isolated and await self._docker_ready():
             result = await self._execute_docker(code, language, timeout)
         else:
-            if isolated and not self.docker_available:
+            if isolated and not self._warned_no_docker:
+                # Docker availability doesn't change at runtime; say so once
                 logger.warning("Docker not available, falling back to direct execution")
+                self._warned_no_docker = True
             result = await self._execute_direct(code, language, timeout)
 
         return result.to_string()
@@ -137,8 +143,6 @@ class ExecutionTool:
         timeout: int
     ) -> ExecutionResult:
         """Execute code directly on the host."""
-        import time
-
         # Create temp file with code
         ext = self.EXTENSIONS[language]
         with tempfile.NamedTemporaryFile(mode='w', suffix=ext, delete=False) as f:
@@ -146,7 +150,7 @@ class ExecutionTool:
             temp_path = f.name
 
         try:
-            cmd = self.COMMANDS[language] + [temp_path]
+            cmd = [*self.COMMANDS[language], temp_path]
             start_time = time.time()
 
             process = await asyncio.create_subprocess_exec(
@@ -193,8 +197,6 @@ class ExecutionTool:
         timeout: int
     ) -> ExecutionResult:
         """Execute code in Docker container."""
-        import time
-
         image = self.DOCKER_IMAGES[language]
         ext = self.EXTENSIONS[language]
 
@@ -205,7 +207,7 @@ class ExecutionTool:
 
         try:
             # Build Docker command
-            cmd_in_container = self.COMMANDS[language] + [f"/code/code{ext}"]
+            cmd_in_container = [*self.COMMANDS[language], f"/code/code{ext}"]
 
             docker_cmd = [
                 "docker", "run",
@@ -267,8 +269,6 @@ class ExecutionTool:
         timeout: int = 30
     ) -> ExecutionResult:
         """Execute a bash command directly (for captures)."""
-        import time
-
         start_time = time.time()
 
         process = await asyncio.create_subprocess_shell(
@@ -35,9 +35,16 @@ class MemoryTools:
     - crucible_reflect: Get memory summary
     """
 
-    def __init__(self, memory_manager: MemoryManager):
+    def __init__(self, memory_manager: MemoryManager, janitor: Optional[MemoryJanitor] = None):
+        """
+        Initialize memory tools.
+
+        Args:
+            memory_manager: The memory system to expose
+            janitor: Optional shared MemoryJanitor (created if not given)
+        """
         self.memory = memory_manager
-        self.janitor = MemoryJanitor(
+        self.janitor = janitor or MemoryJanitor(
             memory_manager.session,
             memory_manager.episodic,
             memory_manager.semantic,
@@ -10,18 +10,42 @@ Runs multiple checks:
 """
 
 import ast
+import asyncio
+import hashlib
+import importlib.util
+import json
 import subprocess
 import tempfile
 import os
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
+from collections import OrderedDict
 import logging
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger('crucible.verify')
 
 
-@dataclass
+def _module_resolves(module: str) -> bool:
+    """
+    Whether a top-level module can be found, without importing (running) it.
+
+    Not memoized: importlib's path finders already cache directory listings
+    (invalidated by mtime), and a module installed mid-session must be seen.
+    """
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@dataclass(slots=True)
 class CheckResult:
     """Result of a single check."""
     name: str
@@ -30,7 +54,7 @@ class CheckResult:
     details: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Complete verification result."""
     passed: bool
@@ -62,8 +86,22 @@ class VerificationTool:
     Supports Python (primary), with extensibility for other languages.
     """
 
+    RESULT_CACHE_SIZE = 128  # Recently verified snippets to remember
+
     def __init__(self):
-        self.available_checks = self._detect_available_checks()
+        # Probing for mypy/flake8/bandit walks sys.path; defer until needed
+        self._available_checks: Optional[Dict[str, bool]] = None
+        # Formatted results keyed by a hash of (language, checks, code), LRU order
+        self._result_cache: "OrderedDict[str, str]" = OrderedDict()
+
+    @property
+    def available_checks(self) -> Dict[str, bool]:
+        """Available checks, detected on first use (missing tools are re-probed)."""
+        # Re-detect while anything is missing so a tool installed mid-session
+        # is picked up; the probes are find_spec lookups, not subprocesses
+        if self._available_checks is None or not all(self._available_checks.values()):
+            self._available_checks = self._detect_available_checks()
+        return self._available_checks
 
     def _detect_available_checks(self) -> Dict[str, bool]:
         """Detect which verification tools are available."""
@@ -77,17 +115,41 @@ class VerificationTool:
         return checks
 
     def _check_tool_available(self, tool: str) -> bool:
-        """Check if a tool is installed."""
+        """Check if a tool is installed (importable by this interpreter)."""
+        # Checks run as `python -m <tool>`, so a module lookup answers the
+        # question without spawning a --version subprocess per tool
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", tool, "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return importlib.util.find_spec(tool) is not None
+        except (ImportError, ValueError):
             return False
 
+    async def _run_tool(self, args: List[str], timeout: float) -> Tuple[int, str]:
+        """
+        Run a checker subprocess without blocking the event loop.
+
+        Args:
+            args: Command line to execute
+            timeout: Seconds before the process is killed
+
+        Returns:
+            Tuple of (return code, decoded stdout)
+
+        Raises:
+            subprocess.TimeoutExpired: If the process outlives timeout
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(args, timeout)
+        return proc.returncode, stdout.decode(errors='replace')
+
     async def verify(
         self,
         code: str,
@@ -111,25 +173,20 @@ class VerificationTool:
         if checks is None:
             checks = ["syntax", "imports"]
 
-        results = []
-
-        for check in checks:
-            if check == "syntax":
-                results.append(self._check_syntax(code))
-            elif check == "imports":
-                results.append(self._check_imports(code))
-            elif check == "types":
-                results.append(await self._check_types(code))
-            elif check == "lint":
-                results.append(await self._check_lint(code))
-            elif check == "security":
-                results.append(await self._check_security(code))
-            else:
-                results.append(CheckResult(
-                    name=check,
-                    passed=False,
-                    message=f"Unknown check: {check}"
-                ))
+        # Re-verifying unchanged code (a common retry pattern) skips the subprocesses.
+        # The key is hashed piecewise so large snippets aren't copied into a joined string.
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{language}\0{','.join(checks)}\0".encode())
+        digest.update(code.encode())
+        cache_key = digest.hexdigest()
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return cached
+
+        # mypy/flake8/bandit are independent subprocesses, so overlap them;
+        # total wall time becomes the slowest check rather than the sum
+        results = await asyncio.gather(*(self._run_check(check, code) for check in checks))
 
         all_passed = all(r.passed for r in results)
         summary = f"{sum(1 for r in results if r.passed)}/{len(results)} checks passed"
@@ -138,9 +195,43 @@ class VerificationTool:
             passed=all_passed,
             checks=results,
             summary=summary
+        ).to_string()
+
+        # Only cache outcomes that depend on the code alone. Timeouts are
+        # transient, and a missing import or a skipped tool can be fixed by
+        # installing something, after which a retry must re-run the checks.
+        if not any(self._environment_dependent(r) for r in results):
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+        return result
+
+    @staticmethod
+    def _environment_dependent(result: CheckResult) -> bool:
+        """Whether a check's outcome could change without the code changing."""
+        return (
+            result.message.endswith(("timed out", "(skipped)")) or
+            (result.name == "Imports" and not result.passed)
         )
 
-        return result.to_string()
+    async def _run_check(self, check: str, code: str) -> CheckResult:
+        """Dispatch a single named check."""
+        if check == "syntax":
+            return self._check_syntax(code)
+        elif check == "imports":
+            return self._check_imports(code)
+        elif check == "types":
+            return await self._check_types(code)
+        elif check == "lint":
+            return await self._check_lint(code)
+        elif check == "security":
+            return await self._check_security(code)
+        return CheckResult(
+            name=check,
+            passed=False,
+            message=f"Unknown check: {check}"
+        )
 
     def _check_syntax(self, code: str) -> CheckResult:
         """Check Python syntax using ast."""
@@ -179,12 +270,7 @@ class VerificationTool:
                 if node.module:
                     imports.append(node.module.split('.')[0])
 
-        missing = []
-        for module in set(imports):
-            try:
-                __import__(module)
-            except ImportError:
-                missing.append(module)
+        missing = [module for module in set(imports) if not _module_resolves(module)]
 
         if missing:
             return CheckResult(
@@ -214,21 +300,19 @@ class VerificationTool:
             temp_path = f.name
 
         try:
-            result = subprocess.run(
+            returncode, stdout = await self._run_tool(
                 [sys.executable, "-m", "mypy", "--ignore-missing-imports", temp_path],
-                capture_output=True,
-                text=True,
                 timeout=30
             )
 
-            if result.returncode == 0:
+            if returncode == 0:
                 return CheckResult(
                     name="Types",
                     passed=True,
                     message="No type errors found"
                 )
             else:
-                errors = [l for l in result.stdout.split('\n') if l.strip() and ':' in l]
+                errors = [l for l in stdout.split('\n') if l.strip() and ':' in l]
                 return CheckResult(
                     name="Types",
                     passed=False,
@@ -259,21 +343,19 @@ class VerificationTool:
             temp_path = f.name
 
         try:
-            result = subprocess.run(
+            returncode, stdout = await self._run_tool(
                 [sys.executable, "-m", "flake8", "--max-line-length=120", temp_path],
-                capture_output=True,
-                text=True,
                 timeout=30
             )
 
-            if result.returncode == 0:
+            if returncode == 0:
                 return CheckResult(
                     name="Lint",
                     passed=True,
                     message="No lint issues found"
                 )
             else:
-                issues = [l for l in result.stdout.split('\n') if l.strip()]
+                issues = [l for l in stdout.split('\n') if l.strip()]
                 return CheckResult(
                     name="Lint",
                     passed=False,
@@ -304,16 +386,13 @@ class VerificationTool:
             temp_path = f.name
 
         try:
-            result = subprocess.run(
+            returncode, stdout = await self._run_tool(
                 [sys.executable, "-m", "bandit", "-f", "json", temp_path],
-                capture_output=True,
-                text=True,
                 timeout=30
             )
 
-            import json
             try:
-                data = json.loads(result.stdout)
+                data = orjson.loads(stdout) if HAS_ORJSON else json.loads(stdout)
                 issues = data.get("results", [])
 
                 if not issues: